@@ -0,0 +1,9 @@
+"""KServe v2 protobuf and gRPC stubs for the RxInfer streaming demo.
+
+The ``inference_pb2`` and ``inference_pb2_grpc`` modules are generated from
+``proto/kserve/v2/inference.proto`` when the package is built (see setup.py).
+"""
+
+from . import inference_pb2, inference_pb2_grpc
+
+__all__ = ["inference_pb2", "inference_pb2_grpc"]
@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""Build the rxinfer_proto package from the repository's KServe v2 proto."""
+
+import os
+import re
+
+from setuptools import setup
+from setuptools.command.build_py import build_py
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+PACKAGE_DIR = os.path.join(HERE, "rxinfer_proto")
+
+# The proto lives at the repository root; RXINFER_PROTO_DIR overrides it when
+# the client is built outside the repository layout (e.g. in Docker)
+PROTO_DIR = os.environ.get(
+    "RXINFER_PROTO_DIR",
+    os.path.join(HERE, "..", "..", "..", "proto", "kserve", "v2"),
+)
+
+
+def generate_stubs():
+    """Generate inference_pb2 and inference_pb2_grpc inside rxinfer_proto."""
+    from grpc_tools import protoc
+
+    status = protoc.main([
+        "grpc_tools.protoc",
+        f"-I{PROTO_DIR}",
+        f"--python_out={PACKAGE_DIR}",
+        f"--grpc_python_out={PACKAGE_DIR}",
+        os.path.join(PROTO_DIR, "inference.proto"),
+    ])
+    if status != 0:
+        raise RuntimeError(f"protoc failed with exit code {status}")
+
+    # protoc emits a top-level import; make it relative to the package
+    grpc_module = os.path.join(PACKAGE_DIR, "inference_pb2_grpc.py")
+    with open(grpc_module) as f:
+        source = f.read()
+    source = re.sub(
+        r"^import inference_pb2 as", "from . import inference_pb2 as",
+        source, flags=re.MULTILINE
+    )
+    with open(grpc_module, "w") as f:
+        f.write(source)
+
+
+class BuildProto(build_py):
+    """build_py that generates the gRPC stubs before copying the package."""
+
+    def run(self):
+        generate_stubs()
+        super().run()
+
+
+if __name__ == "__main__":
+    setup(
+        name="rxinfer_proto",
+        version="0.1.0",
+        description="KServe v2 gRPC stubs for the RxInfer streaming demo",
+        packages=["rxinfer_proto"],
+        install_requires=["grpcio", "protobuf"],
+        cmdclass={"build_py": BuildProto},
+    )
@@ -8,26 +8,137 @@ RxInferKServe gRPC server for online inference.
 
 import grpc
 import numpy as np
+from numba import njit, types
 import time
 import json
-from typing import Dict, Any, Optional
-import matplotlib.pyplot as plt
-from collections import deque
+from typing import Dict, Any, List, Optional, Tuple
 import signal
 import sys
 import os
+import asyncio
+import multiprocessing as mp
+import queue
 
 # Import the generated gRPC code
-from kserve.v2 import inference_pb2
-from kserve.v2 import inference_pb2_grpc
+from rxinfer_proto import inference_pb2, inference_pb2_grpc
+
+# Numpy dtypes for the little-endian raw tensor encoding of each datatype
+RAW_DTYPES = {"FP64": "<f8", "FP32": "<f4"}
+
+# gRPC channel options tuned for sustained high-rate streaming
+CHANNEL_OPTIONS = [
+    # Allow large tensor payloads in either direction (default is 4 MiB)
+    ("grpc.max_send_message_length", 64 << 20),
+    ("grpc.max_receive_message_length", 64 << 20),
+    # Grow HTTP/2 flow-control windows from bandwidth-delay product probes
+    ("grpc.http2.bdp_probe", 1),
+    # Largest frame size HTTP/2 permits (2^24 - 1), so big messages need
+    # fewer frames and writes
+    ("grpc.http2.max_frame_size", (1 << 24) - 1),
+    # Ping idle connections so a dead peer is noticed between batches
+    ("grpc.keepalive_time_ms", 20000),
+    # Keep this channel's subchannels out of the process-wide shared pool
+    ("grpc.use_local_subchannel_pool", 1),
+]
+
+
+# Sequential state recurrences compiled to native code. Noise is drawn in
+# bulk by the caller's Generator so the kernels stay deterministic and the
+# explicit signatures let Numba compile (or load from cache) at import time.
+@njit("f8[:](f8[:], f8[:, :], f8[:])", cache=True, fastmath=True)
+def _kalman_kernel(state, process_noise, obs_noise):
+    """Advance [position, velocity] in place and return noisy positions."""
+    n = obs_noise.shape[0]
+    out = np.empty(n)
+    position = state[0]
+    velocity = state[1]
+    for i in range(n):
+        # State transition A = [[1, 1], [0, 1]] with process noise
+        position += velocity + process_noise[i, 0]
+        velocity += process_noise[i, 1]
+        # Observation (position only) with noise
+        out[i] = position + obs_noise[i]
+    state[0] = position
+    state[1] = velocity
+    return out
+
+
+@njit("f8[:](f8[:], b1[:], f8[:], f8[:], f8[:])", cache=True, fastmath=True)
+def _ar_kernel(state, changes, alpha_jitter, beta_jitter, noise):
+    """Advance [value, alpha, beta] in place and return the AR(1) samples."""
+    n = noise.shape[0]
+    out = np.empty(n)
+    value = state[0]
+    alpha = state[1]
+    beta = state[2]
+    for i in range(n):
+        # Occasionally change parameters
+        if changes[i]:
+            alpha += alpha_jitter[i]
+            beta = min(max(beta + beta_jitter[i], -0.99), 0.99)
+        value = alpha + beta * value + noise[i]
+        out[i] = value
+    state[0] = value
+    state[1] = alpha
+    state[2] = beta
+    return out
+
+
+@njit("f8[:](i8[:], f8[:, :], b1[:], i8[:], f8[:])", cache=True, fastmath=True)
+def _mixture_kernel(state, regime_params, switches, proposals, noise):
+    """Advance [regime, t] in place and return samples from the regimes.
+
+    ``regime_params`` holds one ``(mean, std, trend)`` row per regime.
+    """
+    n = noise.shape[0]
+    out = np.empty(n)
+    regime = state[0]
+    t = state[1]
+    for i in range(n):
+        # Occasionally switch regime
+        if switches[i]:
+            regime = proposals[i]
+        mean = regime_params[regime, 0] + regime_params[regime, 2] * t
+        out[i] = mean + regime_params[regime, 1] * noise[i]
+        t += 1
+    state[0] = regime
+    state[1] = t
+    return out
+
+
+# Read-only, any-layout 1-D float64 arrays. The one eagerly compiled signature
+# accepts both RingBuffer.last() views into the live buffers and the copies it
+# returns when the window wraps; read-only marks that the kernel never writes
+# to the buffers it reads
+_READONLY_F8 = types.Array(types.float64, 1, "A", readonly=True)
+
+
+@njit(types.float64(_READONLY_F8, _READONLY_F8), cache=True)
+def window_rmse(values, refs):
+    """Root-mean-square of ``values - refs`` over their common length.
+    
+    Sums squared errors in one pass without materializing error arrays.
+    """
+    n = min(values.shape[0], refs.shape[0])
+    if n == 0:
+        return np.nan
+    total = 0.0
+    for i in range(n):
+        err = values[i] - refs[i]
+        total += err * err
+    return np.sqrt(total / n)
 
 
 class StreamingDataGenerator:
     """Generates synthetic streaming data with various patterns."""
     
     def __init__(self, seed: Optional[int] = None):
-        if seed:
-            np.random.seed(seed)
+        # One independent Generator per stream, spawned from a single seed, so
+        # each stream replays identically however the concurrent tasks interleave
+        kalman_seq, ar_seq, mixture_seq = np.random.SeedSequence(seed).spawn(3)
+        self.kalman_rng = np.random.default_rng(kalman_seq)
+        self.ar_rng = np.random.default_rng(ar_seq)
+        self.mixture_rng = np.random.default_rng(mixture_seq)
         self.t = 0
         self.regime = 0
         self.regime_params = [
@@ -35,170 +146,237 @@ class StreamingDataGenerator:
             {"mean": 2.0, "std": 0.5, "trend": -0.02},
             {"mean": -1.0, "std": 1.5, "trend": 0.0}
         ]
+        self._regime_table = np.array(
+            [[p["mean"], p["std"], p["trend"]] for p in self.regime_params]
+        )
+        
+        # True hidden Kalman state: position and velocity
+        self.kalman_state = np.array([0.0, 0.1])
+        
+        # AR(1) state and its time-varying parameters
+        self.ar_state = 0.0
+        self.ar_alpha = 0.0
+        self.ar_beta = 0.8
         
     def generate_kalman_data(self, n: int = 1) -> np.ndarray:
         """Generate data for Kalman filter (position with velocity)."""
-        data = []
-        for _ in range(n):
-            # True hidden state: position and velocity
-            if not hasattr(self, 'kalman_state'):
-                self.kalman_state = np.array([0.0, 0.1])
-            
-            # State transition with noise
-            A = np.array([[1.0, 1.0], [0.0, 1.0]])
-            process_noise = np.random.multivariate_normal(
-                [0, 0], [[0.01, 0], [0, 0.001]]
-            )
-            self.kalman_state = A @ self.kalman_state + process_noise
-            
-            # Observation (position only) with noise
-            obs = self.kalman_state[0] + np.random.normal(0, 0.1)
-            data.append(obs)
-            
-        return np.array(data)
+        process_noise = self.kalman_rng.multivariate_normal(
+            [0, 0], [[0.01, 0], [0, 0.001]], size=n
+        )
+        obs_noise = self.kalman_rng.normal(0, 0.1, n)
+        return _kalman_kernel(self.kalman_state, process_noise, obs_noise)
     
     def generate_ar_data(self, n: int = 1, change_prob: float = 0.01) -> np.ndarray:
         """Generate AR(1) data with time-varying parameters."""
-        data = []
-        for _ in range(n):
-            if not hasattr(self, 'ar_state'):
-                self.ar_state = 0.0
-                self.ar_alpha = 0.0
-                self.ar_beta = 0.8
-            
-            # Occasionally change parameters
-            if np.random.rand() < change_prob:
-                self.ar_alpha += np.random.normal(0, 0.1)
-                self.ar_beta += np.random.normal(0, 0.05)
-                self.ar_beta = np.clip(self.ar_beta, -0.99, 0.99)
-            
-            # Generate next value
-            self.ar_state = (
-                self.ar_alpha + 
-                self.ar_beta * self.ar_state + 
-                np.random.normal(0, 0.5)
-            )
-            data.append(self.ar_state)
-            
-        return np.array(data)
+        changes = self.ar_rng.random(n) < change_prob
+        alpha_jitter = self.ar_rng.normal(0, 0.1, n)
+        beta_jitter = self.ar_rng.normal(0, 0.05, n)
+        noise = self.ar_rng.normal(0, 0.5, n)
+        
+        state = np.array([self.ar_state, self.ar_alpha, self.ar_beta])
+        data = _ar_kernel(state, changes, alpha_jitter, beta_jitter, noise)
+        self.ar_state, self.ar_alpha, self.ar_beta = state.tolist()
+        return data
     
     def generate_mixture_data(self, n: int = 1, switch_prob: float = 0.02) -> np.ndarray:
         """Generate data from mixture model with regime switches."""
-        data = []
-        for _ in range(n):
-            # Occasionally switch regime
-            if np.random.rand() < switch_prob:
-                self.regime = np.random.randint(0, len(self.regime_params))
-            
-            # Generate from current regime
-            params = self.regime_params[self.regime]
-            value = np.random.normal(
-                params["mean"] + params["trend"] * self.t,
-                params["std"]
-            )
-            data.append(value)
-            self.t += 1
-            
-        return np.array(data)
+        switches = self.mixture_rng.random(n) < switch_prob
+        proposals = self.mixture_rng.integers(0, len(self.regime_params), n, dtype=np.int64)
+        noise = self.mixture_rng.standard_normal(n)
+        
+        state = np.array([self.regime, self.t], dtype=np.int64)
+        data = _mixture_kernel(state, self._regime_table, switches, proposals, noise)
+        self.regime, self.t = state.tolist()
+        return data
 
 
 class RxInferStreamingClient:
     """gRPC client for streaming inference with RxInferKServe."""
     
-    def __init__(self, server_address: str = "localhost:8081"):
-        self.channel = grpc.insecure_channel(server_address)
+    def __init__(
+        self,
+        server_address: str = "localhost:8081",
+        options: Optional[List[Tuple[str, Any]]] = None
+    ):
+        self.channel = grpc.aio.insecure_channel(
+            server_address,
+            options=CHANNEL_OPTIONS if options is None else options
+        )
         self.stub = inference_pb2_grpc.GRPCInferenceServiceStub(self.channel)
         self.model_states = {}  # Store state for each model
         
-    def check_server_live(self) -> bool:
+        # One reusable request per model; only payload fields are rewritten
+        # between calls. Each entry has its own lock so a request is never
+        # mutated while a call using it is still in flight.
+        self._req_cache: Dict[str, inference_pb2.ModelInferRequest] = {}
+        self._req_locks: Dict[str, asyncio.Lock] = {}
+        
+        # Serialized JSON of each model's state, replaced whenever a
+        # response carries a new state, so it is never re-serialized per call
+        self._state_cache: Dict[str, str] = {}
+        
+    async def close(self):
+        """Close the underlying gRPC channel."""
+        await self.channel.close()
+        
+    async def check_server_live(self) -> bool:
         """Check if server is live."""
         request = inference_pb2.ServerLiveRequest()
         try:
-            response = self.stub.ServerLive(request)
+            response = await self.stub.ServerLive(request)
             return response.live
         except grpc.RpcError:
             return False
     
-    def check_model_ready(self, model_name: str) -> bool:
+    async def check_model_ready(self, model_name: str) -> bool:
         """Check if model is ready."""
         request = inference_pb2.ModelReadyRequest(name=model_name)
         try:
-            response = self.stub.ModelReady(request)
+            response = await self.stub.ModelReady(request)
             return response.ready
         except grpc.RpcError:
             return False
     
-    def create_tensor(self, name: str, data: np.ndarray, datatype: str = "FP64") -> Dict:
-        """Create tensor in KServe v2 format."""
-        # Flatten data to 1D
-        flat_data = data.flatten()
+    async def wait_model_ready(
+        self, model_name: str, attempts: int = 10, delay: float = 0.5
+    ) -> bool:
+        """Poll until a model is ready, giving up after ``attempts`` checks."""
+        for _ in range(attempts):
+            if await self.check_model_ready(model_name):
+                return True
+            await asyncio.sleep(delay)
+        return False
+    
+    def create_tensor(
+        self, name: str, data: np.ndarray, datatype: str = "FP64"
+    ) -> Tuple[inference_pb2.ModelInferRequest.InferInputTensor, bytes]:
+        """Create tensor in KServe v2 format.
         
-        # Create InferInputTensor
+        Returns the tensor metadata together with its payload encoded as
+        little-endian bytes for the request's ``raw_input_contents``.
+        """
+        if datatype not in RAW_DTYPES:
+            raise ValueError(f"Unsupported datatype: {datatype}")
+        
+        # Create InferInputTensor (contents travel as raw bytes)
         tensor = inference_pb2.ModelInferRequest.InferInputTensor(
             name=name,
             datatype=datatype,
             shape=list(data.shape)
         )
+        raw = np.ascontiguousarray(data, dtype=RAW_DTYPES[datatype]).tobytes()
         
-        # Set contents based on datatype
-        if datatype == "FP64":
-            tensor.contents.fp64_contents.extend(flat_data.tolist())
-        elif datatype == "FP32":
-            tensor.contents.fp32_contents.extend(flat_data.astype(np.float32).tolist())
-        else:
-            raise ValueError(f"Unsupported datatype: {datatype}")
-        
-        return tensor
+        return tensor, raw
+    
+    def _cached_request(
+        self, model_name: str
+    ) -> Tuple[inference_pb2.ModelInferRequest, asyncio.Lock]:
+        """Get (or create) the reusable request and its lock for a model."""
+        if model_name not in self._req_cache:
+            self._req_cache[model_name] = inference_pb2.ModelInferRequest(
+                model_name=model_name
+            )
+            self._req_locks[model_name] = asyncio.Lock()
+        return self._req_cache[model_name], self._req_locks[model_name]
     
-    def streaming_inference(
+    async def streaming_inference(
         self, 
         model_name: str, 
         data_batch: Dict[str, np.ndarray],
         parameters: Optional[Dict[str, Any]] = None
     ) -> Dict[str, Any]:
         """Perform streaming inference on a batch of data."""
-        # Create inference request
-        request = inference_pb2.ModelInferRequest(
-            model_name=model_name,
-            id=f"{model_name}_{int(time.time()*1000)}"
-        )
+        request, lock = self._cached_request(model_name)
+        async with lock:
+            return await self._infer_locked(
+                request, model_name, data_batch, parameters
+            )
+    
+    def _serialized_state(self, model_name: str) -> str:
+        """JSON for a model's state, serialized once per state update."""
+        cached = self._state_cache.get(model_name)
+        if cached is None:
+            cached = json.dumps(self.model_states[model_name])
+            self._state_cache[model_name] = cached
+        return cached
+    
+    async def _infer_locked(
+        self,
+        request: inference_pb2.ModelInferRequest,
+        model_name: str,
+        data_batch: Dict[str, np.ndarray],
+        parameters: Optional[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """Fill the cached request for this batch and run inference."""
+        request.id = f"{model_name}_{int(time.time()*1000)}"
+        
+        # Add input tensors, rewriting only the payload when the input
+        # layout is unchanged from the previous call
+        if [tensor.name for tensor in request.inputs] == list(data_batch):
+            for i, (name, data) in enumerate(data_batch.items()):
+                tensor = request.inputs[i]
+                if list(tensor.shape) != list(data.shape):
+                    del tensor.shape[:]
+                    tensor.shape.extend(data.shape)
+                request.raw_input_contents[i] = np.ascontiguousarray(
+                    data, dtype=RAW_DTYPES[tensor.datatype]
+                ).tobytes()
+        else:
+            del request.inputs[:]
+            request.ClearField("raw_input_contents")
+            for name, data in data_batch.items():
+                tensor, raw = self.create_tensor(name, data)
+                request.inputs.append(tensor)
+                request.raw_input_contents.append(raw)
         
-        # Add input tensors
-        for name, data in data_batch.items():
-            tensor = self.create_tensor(name, data)
-            request.inputs.append(tensor)
+        # Drop parameters left over from a previous call
+        keep = set(parameters or ())
+        if model_name in self.model_states:
+            keep.add("model_state")
+        for key in list(request.parameters):
+            if key not in keep:
+                del request.parameters[key]
         
-        # Add parameters if provided
+        # Add parameters if provided, updating the cached request's
+        # InferParameter entries in place
         if parameters:
             for key, value in parameters.items():
-                param = inference_pb2.InferParameter()
+                param = request.parameters[key]
                 if isinstance(value, bool):
                     param.bool_param = value
                 elif isinstance(value, int):
                     param.int64_param = value
                 elif isinstance(value, str):
                     param.string_param = value
-                request.parameters[key].CopyFrom(param)
         
         # Add model state if exists
         if model_name in self.model_states:
-            state_param = inference_pb2.InferParameter()
-            state_param.string_param = json.dumps(self.model_states[model_name])
-            request.parameters["model_state"].CopyFrom(state_param)
+            request.parameters["model_state"].string_param = (
+                self._serialized_state(model_name)
+            )
         
         # Perform inference
         try:
-            response = self.stub.ModelInfer(request)
+            response = await self.stub.ModelInfer(request)
             
-            # Parse outputs
+            # Parse outputs, preferring raw_output_contents when the server
+            # sent one entry per output
             results = {}
-            for output in response.outputs:
-                if output.datatype == "FP64":
+            use_raw = len(response.raw_output_contents) == len(response.outputs)
+            for i, output in enumerate(response.outputs):
+                if output.datatype not in RAW_DTYPES:
+                    continue
+                
+                if use_raw:
+                    # Zero-copy view over the raw little-endian payload
+                    data = np.frombuffer(
+                        response.raw_output_contents[i],
+                        dtype=RAW_DTYPES[output.datatype]
+                    )
+                elif output.datatype == "FP64":
                     data = np.array(output.contents.fp64_contents)
-                elif output.datatype == "FP32":
-                    data = np.array(output.contents.fp32_contents)
                 else:
-                    continue
+                    data = np.array(output.contents.fp32_contents)
                     
                 # Reshape data
                 data = data.reshape(output.shape)
@@ -206,9 +384,10 @@ class RxInferStreamingClient:
             
             # Extract and store model state if present
             if "model_state" in response.parameters:
-                self.model_states[model_name] = json.loads(
-                    response.parameters["model_state"].string_param
-                )
+                serialized = response.parameters["model_state"].string_param
+                state = json.loads(serialized)
+                self.model_states[model_name] = state
+                self._state_cache[model_name] = serialized
             
             return results
             
@@ -217,6 +396,59 @@ class RxInferStreamingClient:
             return {}
 
 
+class RingBuffer:
+    """Fixed-capacity ring buffer over a preallocated ndarray.
+    
+    Items are scalars by default, or arrays of ``shape`` (e.g. ``(2,)`` for
+    parameter pairs). The oldest items are overwritten once full.
+    """
+    
+    def __init__(self, n: int, shape: Tuple[int, ...] = (), dtype=np.float64):
+        self._buf = np.empty((n, *shape), dtype=dtype)
+        self._shape = shape
+        self._head = 0  # Next write position
+        self._size = 0
+    
+    def __len__(self) -> int:
+        return self._size
+    
+    def extend(self, arr) -> None:
+        """Append a batch of items."""
+        arr = np.asarray(arr, dtype=self._buf.dtype).reshape(-1, *self._shape)
+        n = self._buf.shape[0]
+        k = arr.shape[0]
+        if k >= n:
+            self._buf[:] = arr[-n:]
+            self._head = 0
+            self._size = n
+            return
+        
+        end = self._head + k
+        if end <= n:
+            self._buf[self._head:end] = arr
+        else:
+            split = n - self._head
+            self._buf[self._head:] = arr[:split]
+            self._buf[:end - n] = arr[split:]
+        self._head = end % n
+        self._size = min(self._size + k, n)
+    
+    def append(self, item) -> None:
+        """Append a single item."""
+        self.extend(np.asarray(item, dtype=self._buf.dtype)[np.newaxis])
+    
+    def last(self, k: Optional[int] = None) -> np.ndarray:
+        """Return the newest ``k`` items (all by default), oldest first.
+        
+        The result is a view into the buffer unless it wraps around.
+        """
+        k = self._size if k is None else min(k, self._size)
+        start = self._head - k
+        if start >= 0:
+            return self._buf[start:self._head]
+        return np.concatenate((self._buf[start:], self._buf[:self._head]))
+
+
 class StreamingDemo:
     """Main demo class that orchestrates streaming inference."""
     
@@ -226,12 +458,12 @@ class StreamingDemo:
         self.running = True
         
         # Data buffers for plotting
-        self.kalman_data = deque(maxlen=200)
-        self.kalman_estimates = deque(maxlen=200)
-        self.ar_data = deque(maxlen=200)
-        self.ar_params = deque(maxlen=200)
-        self.mixture_data = deque(maxlen=200)
-        self.mixture_regimes = deque(maxlen=200)
+        self.kalman_data = RingBuffer(200)
+        self.kalman_estimates = RingBuffer(200)
+        self.ar_data = RingBuffer(200)
+        self.ar_params = RingBuffer(200, shape=(2,))
+        self.mixture_data = RingBuffer(200)
+        self.mixture_regimes = RingBuffer(200)
         
         # Setup signal handler
         signal.signal(signal.SIGINT, self._signal_handler)
@@ -241,10 +473,26 @@ class StreamingDemo:
         print("\nStopping streaming demo...")
         self.running = False
         
-    def run_kalman_stream(self, batch_size: int = 10, interval: float = 0.1):
+    async def _pace(self, deadline: float, interval: float) -> float:
+        """Sleep until a monotonic deadline and return the next one.
+        
+        Pacing against deadlines rather than sleeping a fixed interval after
+        each batch keeps the request rate steady regardless of inference
+        latency. A loop that has fallen more than one interval behind
+        resynchronizes instead of firing a burst of catch-up requests.
+        """
+        now = time.monotonic()
+        if deadline > now:
+            await asyncio.sleep(deadline - now)
+            now = deadline
+        return max(deadline + interval, now)
+    
+    async def run_kalman_stream(self, batch_size: int = 10, interval: float = 0.1):
         """Run Kalman filter streaming demo."""
         print("Starting Kalman filter streaming...")
         
+        deadline = time.monotonic() + interval
+        
         while self.running:
             # Generate new data
             data = self.generator.generate_kalman_data(batch_size)
@@ -254,7 +502,7 @@ class StreamingDemo:
             batch_data = {"y": data}
             
             # Run inference
-            results = self.client.streaming_inference(
+            results = await self.client.streaming_inference(
                 "streaming_kalman",
                 batch_data,
                 parameters={"Δt": 1.0}
@@ -269,12 +517,14 @@ class StreamingDemo:
                       f"Latest estimate: {positions[-1]:.3f}, "
                       f"Latest observation: {data[-1]:.3f}")
             
-            time.sleep(interval)
+            deadline = await self._pace(deadline, interval)
     
-    def run_ar_stream(self, batch_size: int = 5, interval: float = 0.2):
+    async def run_ar_stream(self, batch_size: int = 5, interval: float = 0.2):
         """Run AR parameter learning streaming demo."""
         print("Starting AR parameter learning streaming...")
         
+        deadline = time.monotonic() + interval
+        
         while self.running:
             # Generate new data
             data = self.generator.generate_ar_data(batch_size, change_prob=0.02)
@@ -282,16 +532,13 @@ class StreamingDemo:
             
             # Use sliding window of recent data
             window_size = 20
-            if len(self.ar_data) >= window_size:
-                window_data = np.array(list(self.ar_data)[-window_size:])
-            else:
-                window_data = np.array(list(self.ar_data))
+            window_data = self.ar_data.last(window_size)
             
             # Prepare batch for inference
             batch_data = {"y": window_data}
             
             # Run inference
-            results = self.client.streaming_inference(
+            results = await self.client.streaming_inference(
                 "online_ar_learning",
                 batch_data,
                 parameters={"window_size": window_size}
@@ -306,12 +553,14 @@ class StreamingDemo:
                 print(f"Processed {batch_size} samples. "
                       f"Parameters: α={alpha:.3f}, β={beta:.3f}")
             
-            time.sleep(interval)
+            deadline = await self._pace(deadline, interval)
     
-    def run_mixture_stream(self, batch_size: int = 20, interval: float = 0.5):
+    async def run_mixture_stream(self, batch_size: int = 20, interval: float = 0.5):
         """Run adaptive mixture model streaming demo."""
         print("Starting adaptive mixture model streaming...")
         
+        deadline = time.monotonic() + interval
+        
         while self.running:
             # Generate new data
             data = self.generator.generate_mixture_data(batch_size, switch_prob=0.02)
@@ -321,7 +570,7 @@ class StreamingDemo:
             batch_data = {"y": data}
             
             # Run inference
-            results = self.client.streaming_inference(
+            results = await self.client.streaming_inference(
                 "adaptive_mixture",
                 batch_data,
                 parameters={"n_components": 3}
@@ -333,77 +582,105 @@ class StreamingDemo:
                 weights = results["π"]
                 self.mixture_regimes.extend(assignments)
                 
-                # Count regime frequencies
-                unique, counts = np.unique(assignments, return_counts=True)
-                regime_dist = dict(zip(unique, counts))
+                # Count regime frequencies (ids are small non-negative ints)
+                counts = np.bincount(
+                    assignments.ravel().astype(np.intp),
+                    minlength=len(self.generator.regime_params)
+                )
+                regime_dist = {i: int(c) for i, c in enumerate(counts) if c}
                 
                 print(f"Processed {batch_size} samples. "
                       f"Regime distribution: {regime_dist}, "
                       f"Weights: {[f'{w:.2f}' for w in weights]}")
             
-            time.sleep(interval)
+            deadline = await self._pace(deadline, interval)
     
-    def plot_results(self):
-        """Create live plots of streaming results."""
-        # Check if we can display
-        import os
-        if not os.environ.get('DISPLAY') and not os.environ.get('MPLBACKEND'):
-            print("No display available, skipping visualization")
-            return
-            
-        plt.ion()
-        fig, axes = plt.subplots(3, 1, figsize=(10, 8))
+    async def publish_snapshots(self, snapshots, period: float = 1.0):
+        """Send buffer snapshots to the plotting process once per period.
         
+        Snapshots are dropped rather than queued when the plotter lags, so
+        rendering never applies back-pressure to the streams.
+        """
+        deadline = time.monotonic() + period
         while self.running:
-            # Clear axes
-            for ax in axes:
-                ax.clear()
-            
-            # Plot Kalman filter results
-            if self.kalman_data:
-                axes[0].plot(list(self.kalman_data), 'b.', alpha=0.5, label='Observations')
-                if self.kalman_estimates:
-                    axes[0].plot(list(self.kalman_estimates), 'r-', label='Estimates')
-                axes[0].set_title('Kalman Filter: Position Tracking')
-                axes[0].legend()
-                axes[0].grid(True)
-            
-            # Plot AR data and parameters
-            if self.ar_data:
-                axes[1].plot(list(self.ar_data), 'g-', label='AR Process')
-                axes[1].set_title('AR(1) Process with Time-Varying Parameters')
-                axes[1].legend()
-                axes[1].grid(True)
-            
-            # Plot mixture data with regime coloring
-            if self.mixture_data and self.mixture_regimes:
-                data = np.array(list(self.mixture_data))
-                regimes = np.array(list(self.mixture_regimes))
-                
-                # Color by regime
-                colors = ['red', 'blue', 'green']
-                for i in range(3):
-                    mask = regimes == i
-                    if np.any(mask):
-                        axes[2].scatter(
-                            np.where(mask)[0], 
-                            data[mask], 
-                            c=colors[i], 
-                            alpha=0.6, 
-                            label=f'Regime {i}'
-                        )
-                
-                axes[2].set_title('Mixture Model: Regime Detection')
-                axes[2].legend()
-                axes[2].grid(True)
+            deadline = await self._pace(deadline, period)
+            try:
+                snapshots.put_nowait({
+                    "kalman_data": self.kalman_data.last(),
+                    "kalman_estimates": self.kalman_estimates.last(),
+                    "ar_data": self.ar_data.last(),
+                    "mixture_data": self.mixture_data.last(),
+                    "mixture_regimes": self.mixture_regimes.last(),
+                })
+            except queue.Full:
+                pass
+
+
+def _plot_worker(snapshots):
+    """Render live plots from buffer snapshots in a separate process."""
+    import matplotlib.pyplot as plt
+    
+    plt.ion()
+    fig, axes = plt.subplots(3, 1, figsize=(10, 8))
+    
+    while True:
+        try:
+            snapshot = snapshots.get(timeout=1.0)
+        except queue.Empty:
+            plt.pause(0.1)
+            continue
+        if snapshot is None:
+            break
+        
+        # Clear axes
+        for ax in axes:
+            ax.clear()
+        
+        # Plot Kalman filter results
+        if len(snapshot["kalman_data"]):
+            axes[0].plot(snapshot["kalman_data"], 'b.', alpha=0.5, label='Observations')
+            if len(snapshot["kalman_estimates"]):
+                axes[0].plot(snapshot["kalman_estimates"], 'r-', label='Estimates')
+            axes[0].set_title('Kalman Filter: Position Tracking')
+            axes[0].legend()
+            axes[0].grid(True)
+        
+        # Plot AR data and parameters
+        if len(snapshot["ar_data"]):
+            axes[1].plot(snapshot["ar_data"], 'g-', label='AR Process')
+            axes[1].set_title('AR(1) Process with Time-Varying Parameters')
+            axes[1].legend()
+            axes[1].grid(True)
+        
+        # Plot mixture data with regime coloring
+        data = snapshot["mixture_data"]
+        regimes = snapshot["mixture_regimes"]
+        if len(data) and len(regimes):
+            # Color by regime
+            colors = ['red', 'blue', 'green']
+            for i in range(3):
+                mask = regimes == i
+                if np.any(mask):
+                    axes[2].scatter(
+                        np.where(mask)[0], 
+                        data[mask], 
+                        c=colors[i], 
+                        alpha=0.6, 
+                        label=f'Regime {i}'
+                    )
             
-            plt.tight_layout()
-            plt.pause(1.0)
+            axes[2].set_title('Mixture Model: Regime Detection')
+            axes[2].legend()
+            axes[2].grid(True)
         
-        plt.ioff()
+        plt.tight_layout()
+        plt.pause(0.1)
+    
+    plt.ioff()
+    plt.close(fig)
 
 
-def main():
+async def main():
     """Main function to run the streaming demo."""
     print("="*60)
     print("RxInferKServe Infinite Data Stream Demo")
@@ -422,11 +699,11 @@ def main():
     # Wait for server to be ready
     max_retries = 30
     for i in range(max_retries):
-        if client.check_server_live():
+        if await client.check_server_live():
             print("   ✓ Server is live!")
             break
         print(f"   Waiting for server... ({i+1}/{max_retries})")
-        time.sleep(1)
+        await asyncio.sleep(1)
     else:
         print("   ✗ ERROR: Server failed to respond!")
         sys.exit(1)
@@ -434,18 +711,15 @@ def main():
     # Check models are ready
     print("\n2. Checking model availability...")
     models = ["streaming_kalman", "online_ar_learning", "adaptive_mixture"]
-    all_ready = True
-    for model in models:
-        for i in range(10):
-            if client.check_model_ready(model):
-                print(f"   ✓ Model {model} is ready!")
-                break
-            time.sleep(0.5)
+    # Poll all models concurrently so their cold starts overlap
+    ready = await asyncio.gather(*(client.wait_model_ready(m) for m in models))
+    for model, is_ready in zip(models, ready):
+        if is_ready:
+            print(f"   ✓ Model {model} is ready!")
         else:
             print(f"   ✗ Model {model} failed to become ready!")
-            all_ready = False
     
-    if not all_ready:
+    if not all(ready):
         print("\n✗ ERROR: Not all models are ready!")
         sys.exit(1)
     
@@ -460,19 +734,27 @@ def main():
     # Create demo
     demo = StreamingDemo(client)
     
-    # Start streaming threads
-    import threading
-    threads = [
-        threading.Thread(target=demo.run_kalman_stream),
-        threading.Thread(target=demo.run_ar_stream),
-        threading.Thread(target=demo.run_mixture_stream),
-        threading.Thread(target=demo.plot_results)
+    # Live plotting is opt-in and renders in a child process so matplotlib
+    # never holds this process's GIL while the streams are running
+    plotter = None
+    tasks = [
+        demo.run_kalman_stream(),
+        demo.run_ar_stream(),
+        demo.run_mixture_stream()
     ]
+    if os.environ.get("RXINFER_PLOT", "0") == "1":
+        if not os.environ.get('DISPLAY') and not os.environ.get('MPLBACKEND'):
+            print("No display available, skipping visualization")
+        else:
+            # Spawn rather than fork: the gRPC channel is not fork-safe
+            ctx = mp.get_context("spawn")
+            snapshots = ctx.Queue(maxsize=2)
+            plotter = ctx.Process(target=_plot_worker, args=(snapshots,), daemon=True)
+            plotter.start()
+            tasks.append(demo.publish_snapshots(snapshots))
     
-    # Start all threads
-    for thread in threads:
-        thread.daemon = True
-        thread.start()
+    # Run the three streams concurrently on this event loop and channel
+    streams = asyncio.gather(*tasks)
     
     # Wait for interrupt and show statistics
     start_time = time.time()
@@ -480,7 +762,7 @@ def main():
     
     try:
         while demo.running:
-            time.sleep(1)
+            await asyncio.sleep(1)
             
             # Print statistics every 10 seconds
             if time.time() - last_stats_time > 10:
@@ -491,19 +773,32 @@ def main():
                 print(f"Mixture samples: {len(demo.mixture_data)}")
                 
                 if demo.kalman_data and demo.kalman_estimates:
-                    # Calculate RMSE for Kalman filter
-                    data = np.array(list(demo.kalman_data))[-100:]
-                    estimates = np.array(list(demo.kalman_estimates))[-100:]
-                    min_len = min(len(data), len(estimates))
-                    if min_len > 0:
-                        rmse = np.sqrt(np.mean((data[:min_len] - estimates[:min_len])**2))
-                        print(f"Kalman RMSE: {rmse:.3f}")
+                    # RMSE for Kalman filter over the last 100 samples
+                    rmse = window_rmse(
+                        demo.kalman_estimates.last(100),
+                        demo.kalman_data.last(100)
+                    )
+                    print(f"Kalman RMSE: {rmse:.3f}")
                 
                 print("---\n")
                 last_stats_time = time.time()
                 
     except KeyboardInterrupt:
         print("\n\nShutting down gracefully...")
+        demo.running = False
+    
+    # Let the streams finish their current batch before closing the channel
+    await streams
+    await client.close()
+    if plotter is not None:
+        # Never block on a plotter that died or stopped draining its queue
+        try:
+            snapshots.put(None, timeout=1.0)
+        except queue.Full:
+            pass
+        plotter.join(timeout=5)
+        if plotter.is_alive():
+            plotter.terminate()
     
     # Final statistics
     elapsed = time.time() - start_time
@@ -527,4 +822,4 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    asyncio.run(main())
\ No newline at end of file
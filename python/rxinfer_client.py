@@ -2,14 +2,114 @@
 Python client for RxInferKServe (KServe v2 compatible)
 """
 
+import array
+import asyncio
+import functools
+import gzip
 import json
-from typing import Dict, Any, Optional, List, Union
+import random
+import struct
+import sys
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Awaitable, Callable, Dict, Any, Iterator, Optional, List, Tuple, Union
 from uuid import UUID, uuid4
 
+import httpx
+import ijson
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
 from pydantic import BaseModel, Field
 
 
+# Response statuses treated as transient and retried by both clients. 500 is
+# left out: the server returns it for every failed inference, bad input
+# included, so retrying would re-run a deterministic failure
+RETRY_STATUS_CODES = (429, 502, 503, 504)
+
+# Request bodies larger than this are gzip-compressed when the server accepts it
+COMPRESS_MIN_BYTES = 8192
+
+# Seconds to wait before re-probing a server whose compression support could
+# not be determined
+GZIP_PROBE_COOLDOWN = 30.0
+
+# struct/numpy type codes for tensors sent with the binary data extension
+BINARY_TYPE_CODES = {
+    "BOOL": "?",
+    "INT8": "b",
+    "INT16": "h",
+    "INT32": "i",
+    "INT64": "q",
+    "UINT8": "B",
+    "UINT16": "H",
+    "UINT32": "I",
+    "UINT64": "Q",
+    "FP32": "f",
+    "FP64": "d",
+}
+
+
+def _tensor_to_bytes(datatype: str, data: Any) -> bytes:
+    """Encode flat tensor data (list or numpy array) as little-endian bytes"""
+    code = BINARY_TYPE_CODES[datatype]
+    if hasattr(data, "tobytes"):
+        # numpy arrays convert in C without boxing each element
+        return data.astype("<" + code, copy=False).tobytes()
+    return struct.pack(f"<{len(data)}{code}", *data)
+
+
+def _bytes_to_tensor(datatype: str, raw: Any) -> Any:
+    """Decode raw little-endian tensor bytes into flat data
+    
+    Numeric tensors become an ``array.array``, which supports the buffer
+    protocol (``np.frombuffer`` views it without copying).
+    """
+    code = BINARY_TYPE_CODES[datatype]
+    if code == "?":
+        return [b != 0 for b in bytes(raw)]
+    data = array.array(code)
+    data.frombytes(raw)
+    if sys.byteorder == "big":
+        data.byteswap()
+    return data
+
+
+def _encode_binary_request(request: Dict[str, Any]) -> Tuple[bytes, int]:
+    """Build a binary tensor extension body: JSON header + raw input data.
+    
+    Returns the body and the length of its JSON header.
+    """
+    chunks = []
+    for tensor in request["inputs"]:
+        if tensor["datatype"] not in BINARY_TYPE_CODES or "data" not in tensor:
+            continue
+        raw = _tensor_to_bytes(tensor["datatype"], tensor.pop("data"))
+        tensor["parameters"] = {
+            **tensor.get("parameters", {}),
+            "binary_data_size": len(raw),
+        }
+        chunks.append(raw)
+    
+    header = orjson.dumps(request, option=orjson.OPT_SERIALIZE_NUMPY)
+    return b"".join([header, *chunks]), len(header)
+
+
+# KServe datatype prefixes for numpy dtype kinds; the bit width is appended
+NUMPY_KIND_TYPES = {"b": "BOOL", "i": "INT", "u": "UINT", "f": "FP"}
+
+
+def _numpy_datatype(dtype: Any) -> Optional[str]:
+    """KServe datatype for a numpy dtype, or None if it has no tensor type"""
+    kind = NUMPY_KIND_TYPES.get(dtype.kind)
+    if kind is None or kind == "BOOL":
+        return kind
+    return f"{kind}{dtype.itemsize * 8}"
+
+
 class TensorMetadata(BaseModel):
     name: str
     datatype: str
@@ -39,17 +139,384 @@ class InferenceResponse(BaseModel):
     parameters: Optional[Dict[str, Any]] = None
 
 
+# Fields a model metadata response may omit
+_METADATA_DEFAULTS: Dict[str, Any] = {
+    "versions": [],
+    "platform": "RxInfer.jl",
+    "inputs": [],
+    "outputs": [],
+}
+
+
+@functools.lru_cache(maxsize=256)
+def _model_path(model_name: str, model_version: Optional[str] = None) -> str:
+    """KServe v2 path of a model, or of one of its versions (cached per model)"""
+    if model_version:
+        return f"/v2/models/{model_name}/versions/{model_version}"
+    return f"/v2/models/{model_name}"
+
+
+def _simple_inputs(data: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Convert an infer_simple data dict to KServe v2 input tensors"""
+    inputs = []
+    for name, value in data.items():
+        datatype = _numpy_datatype(value.dtype) if hasattr(value, "dtype") else None
+        if isinstance(value, list):
+            inputs.append({
+                "name": name,
+                "datatype": "FP64",  # Default to float64
+                "shape": [len(value)],
+                "data": value
+            })
+        elif isinstance(value, (int, float)):
+            inputs.append({
+                "name": name,
+                "datatype": "FP64",
+                "shape": [1],
+                "data": [value]
+            })
+        elif datatype is not None:
+            # Keep numpy arrays native; orjson serializes the flat view in C
+            # without boxing each element into a Python list
+            inputs.append({
+                "name": name,
+                "datatype": datatype,
+                "shape": list(value.shape) or [1],
+                "data": value.reshape(-1)
+            })
+        else:
+            # Convert to JSON string for complex types. This rare path keeps
+            # json.dumps, which accepts non-str dict keys and NaN/inf values
+            # that orjson would reject or send as null
+            inputs.append({
+                "name": name,
+                "datatype": "BYTES",
+                "shape": [1],
+                "data": [json.dumps(value)]
+            })
+    return inputs
+
+
+def _infer_payload(inputs: List[Dict[str, Any]],
+                   outputs: Optional[List[Dict[str, Any]]],
+                   parameters: Optional[Dict[str, Any]],
+                   request_id: Optional[str]) -> Dict[str, Any]:
+    """Validated inference request as a plain dict"""
+    request_data = InferenceRequest(
+        id=request_id or str(uuid4()),
+        inputs=inputs,
+        outputs=outputs,
+        parameters=parameters
+    )
+    return request_data.model_dump(exclude_none=True)
+
+
+def _encode_infer_request(inputs: List[Dict[str, Any]],
+                          outputs: Optional[List[Dict[str, Any]]],
+                          parameters: Optional[Dict[str, Any]],
+                          request_id: Optional[str],
+                          binary_data: bool,
+                          binary_output: Optional[bool] = None) -> Tuple[bytes, Optional[Dict[str, str]]]:
+    """Serialize an inference request; returns the body and any extra headers
+    
+    ``binary_output`` (default: same as ``binary_data``) asks the server to
+    return numeric outputs with the binary tensor extension.
+    """
+    payload = _infer_payload(inputs, outputs, parameters, request_id)
+    if binary_output is None:
+        binary_output = binary_data
+    if binary_output:
+        payload["parameters"] = {
+            **payload.get("parameters", {}),
+            "binary_data_output": True
+        }
+    if binary_data:
+        body, header_length = _encode_binary_request(payload)
+        return body, {
+            "Content-Type": "application/octet-stream",
+            "Inference-Header-Content-Length": str(header_length)
+        }
+    return orjson.dumps(payload, option=orjson.OPT_SERIALIZE_NUMPY), None
+
+
+def _decode_infer_response(content: bytes,
+                           header_length: Optional[str]) -> Dict[str, Any]:
+    """Decode an inference response body
+    
+    With the binary tensor extension (``header_length`` set from the
+    ``Inference-Header-Content-Length`` header), the JSON header is followed
+    by the raw data of each output that has a ``binary_data_size`` parameter,
+    in output order; that data is decoded into the output's ``data`` field.
+    """
+    if header_length is None:
+        return orjson.loads(content)
+    
+    view = memoryview(content)
+    offset = int(header_length)
+    response = orjson.loads(view[:offset])
+    for output in response.get("outputs", []):
+        size = (output.get("parameters") or {}).get("binary_data_size")
+        if size is None:
+            continue
+        output["data"] = _bytes_to_tensor(output["datatype"], view[offset:offset + size])
+        offset += size
+    return response
+
+
+def _gzip_request(body: bytes,
+                  headers: Optional[Dict[str, str]]) -> Tuple[bytes, Dict[str, str]]:
+    """Gzip a request body and add the matching Content-Encoding header
+    
+    Level 1 keeps compression time well below the transfer time it saves;
+    JSON number arrays still shrink several-fold.
+    """
+    return gzip.compress(body, compresslevel=1), {
+        **(headers or {}),
+        "Content-Encoding": "gzip"
+    }
+
+
+def _accepts_gzip(headers: Any) -> bool:
+    """Whether a response advertises gzip request bodies (RFC 7694)"""
+    return "gzip" in headers.get("Accept-Encoding", "").lower()
+
+
+def _encode_batch_request(payloads: List[Dict[str, Any]]) -> bytes:
+    """Serialize the body of an ``infer:batch`` request"""
+    return orjson.dumps({"requests": payloads}, option=orjson.OPT_SERIALIZE_NUMPY)
+
+
+def _decode_batch_response(content: bytes) -> List[Union[Dict[str, Any], Exception]]:
+    """Split an ``infer:batch`` response into per-request results
+    
+    Requests the server could not run come back as ``{"error": ...}`` entries
+    and are returned as exceptions.
+    """
+    return [
+        RuntimeError(item["error"]) if "error" in item else item
+        for item in orjson.loads(content)["responses"]
+    ]
+
+
+def _match_results(results: List[Any], count: int) -> List[Any]:
+    """Pad a batch's results to ``count`` entries
+    
+    Requests the server returned no result for get an exception, so their
+    callers fail instead of waiting forever.
+    """
+    missing = count - len(results)
+    if missing > 0:
+        error = RuntimeError(
+            f"Batch response has {len(results)} results for {count} requests"
+        )
+        results = list(results) + [error] * missing
+    return results
+
+
+class _BatchQueue:
+    """Coalesces concurrent requests to the same URL into batch requests
+    
+    ``submit`` blocks the calling thread until its batch has been sent. A
+    batch is sent once it holds ``max_batch`` requests or its oldest request
+    has waited ``timeout`` seconds. ``send(url, payloads)`` posts one batch
+    and returns a result (response dict or exception) per payload.
+    """
+    
+    def __init__(self, send: Callable[[str, List[Dict[str, Any]]], List[Any]],
+                 max_batch: int, timeout: float):
+        self._send = send
+        self._max_batch = max_batch
+        self._timeout = timeout
+        self._cond = threading.Condition()
+        self._pending: Dict[str, List[Tuple[Dict[str, Any], Future]]] = {}
+        self._deadlines: Dict[str, float] = {}
+        self._closed = False
+        self._senders = ThreadPoolExecutor()
+        threading.Thread(target=self._run, daemon=True).start()
+    
+    def submit(self, url: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+        future = Future()
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("Client is closed")
+            if url not in self._pending:
+                self._pending[url] = []
+                self._deadlines[url] = time.monotonic() + self._timeout
+            batch = self._pending[url]
+            batch.append((payload, future))
+            if len(batch) >= self._max_batch:
+                # Send a full batch right away; later calls start a new one
+                del self._pending[url]
+                del self._deadlines[url]
+                self._senders.submit(self._flush, url, batch)
+            else:
+                self._cond.notify()
+        return future.result()
+    
+    def close(self):
+        """Stop the flusher and fail requests still waiting for a batch"""
+        with self._cond:
+            self._closed = True
+            pending = list(self._pending.values())
+            self._pending.clear()
+            self._deadlines.clear()
+            self._cond.notify()
+        for batch in pending:
+            for _, future in batch:
+                future.set_exception(RuntimeError("Client closed before the request was sent"))
+    
+    def _run(self):
+        while True:
+            with self._cond:
+                if self._closed:
+                    break
+                if not self._pending:
+                    self._cond.wait()
+                    continue
+                
+                # Send the batch whose oldest request is due first once its
+                # deadline passes (full batches are sent by submit)
+                url = min(self._deadlines, key=self._deadlines.get)
+                remaining = self._deadlines[url] - time.monotonic()
+                if remaining > 0:
+                    self._cond.wait(remaining)
+                    continue
+                
+                batch = self._pending.pop(url)
+                del self._deadlines[url]
+            self._senders.submit(self._flush, url, batch)
+        self._senders.shutdown(wait=False)
+    
+    def _flush(self, url: str, batch: List[Tuple[Dict[str, Any], Future]]):
+        try:
+            results = self._send(url, [payload for payload, _ in batch])
+        except Exception as e:
+            results = [e] * len(batch)
+        for (_, future), result in zip(batch, _match_results(results, len(batch))):
+            if isinstance(result, Exception):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+
+class _AsyncBatchQueue:
+    """asyncio counterpart of ``_BatchQueue``"""
+    
+    def __init__(self, send: Callable[[str, List[Dict[str, Any]]], Awaitable[List[Any]]],
+                 max_batch: int, timeout: float):
+        self._send = send
+        self._max_batch = max_batch
+        self._timeout = timeout
+        # url -> (open batch, event set once that batch is full)
+        self._pending: Dict[str, Tuple[List[Tuple[Dict[str, Any], asyncio.Future]], asyncio.Event]] = {}
+        self._tasks = set()
+    
+    async def submit(self, url: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+        future = asyncio.get_running_loop().create_future()
+        if url not in self._pending:
+            self._pending[url] = ([], asyncio.Event())
+            task = asyncio.create_task(self._flush(url, *self._pending[url]))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+        
+        batch, full = self._pending[url]
+        batch.append((payload, future))
+        if len(batch) >= self._max_batch:
+            # Close the batch so later calls start a new one
+            del self._pending[url]
+            full.set()
+        return await future
+    
+    async def _flush(self, url: str,
+                     batch: List[Tuple[Dict[str, Any], asyncio.Future]],
+                     full: asyncio.Event):
+        try:
+            await asyncio.wait_for(full.wait(), self._timeout)
+        except asyncio.TimeoutError:
+            pass
+        if url in self._pending and self._pending[url][0] is batch:
+            del self._pending[url]
+        
+        try:
+            results = await self._send(url, [payload for payload, _ in batch])
+        except Exception as e:
+            results = [e] * len(batch)
+        for (_, future), result in zip(batch, _match_results(results, len(batch))):
+            if future.done():
+                continue  # caller was cancelled
+            if isinstance(result, Exception):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+
+def _model_metadata_from_json(data: Dict[str, Any]) -> ModelMetadata:
+    """Build ModelMetadata from a model metadata response
+    
+    The nested tensor lists are validated in the same pydantic-core pass as
+    the model itself rather than built one ``TensorMetadata`` at a time.
+    """
+    return ModelMetadata.model_validate({**_METADATA_DEFAULTS, **data})
+
+
 class RxInferClient:
     """Python client for RxInferKServe (KServe v2 compatible)"""
     
     def __init__(self, base_url: str = "http://localhost:8080", 
                  api_key: Optional[str] = None,
-                 timeout: int = 30):
+                 timeout: int = 30,
+                 pool_size: int = 64,
+                 retries: int = 3,
+                 backoff_base: float = 0.5,
+                 backoff_max: float = 30.0,
+                 batching: bool = False,
+                 max_batch: int = 32,
+                 batch_timeout_ms: float = 5,
+                 compress_threshold: Optional[int] = COMPRESS_MIN_BYTES):
         self.base_url = base_url.rstrip('/')
         self.api_key = api_key
         self.timeout = timeout
         self.session = requests.Session()
         
+        # Request bodies over compress_threshold bytes (None disables) are
+        # gzipped once the server has advertised support. Only a successful
+        # probe is cached; failed probes are retried after a cooldown
+        self.compress_threshold = compress_threshold
+        self._gzip_accepted: Optional[bool] = None
+        self._gzip_probe_after = 0.0
+        
+        # Opt-in micro-batching: concurrent JSON infer calls to the same model
+        # are coalesced into one infer:batch request
+        self._batcher = (
+            _BatchQueue(self._send_batch, max_batch, batch_timeout_ms / 1000)
+            if batching else None
+        )
+        
+        # Size the connection pool for concurrent use from many threads (the
+        # default adapter keeps at most 10 connections per host) and retry
+        # transient failures with jittered exponential backoff, honouring
+        # Retry-After; the last failed response still reaches
+        # raise_for_status so callers see the usual HTTPError. Read errors are
+        # not retried, since the server may already have run the inference
+        retry = Retry(
+            total=retries,
+            read=False,
+            backoff_factor=backoff_base,
+            backoff_max=backoff_max,
+            backoff_jitter=0.25,
+            status_forcelist=RETRY_STATUS_CODES,
+            allowed_methods=frozenset(["GET", "POST", "DELETE"]),
+            respect_retry_after_header=True,
+            raise_on_status=False
+        )
+        adapter = HTTPAdapter(
+            pool_connections=pool_size,
+            pool_maxsize=pool_size,
+            max_retries=retry
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        
         # Set headers
         self.session.headers.update({
             "Content-Type": "application/json",
@@ -58,91 +525,189 @@ class RxInferClient:
         
         if api_key:
             self.session.headers["X-API-Key"] = api_key
+        
+        # Fixed URLs are built once rather than on every call
+        self._live_url = self.base_url + "/v2/health/live"
+        self._ready_url = self.base_url + "/v2/health/ready"
+        self._models_url = self.base_url + "/v2/models"
+    
+    def _model_url(self, model_name: str, model_version: Optional[str] = None) -> str:
+        """Absolute URL of a model (or model version)"""
+        return self.base_url + _model_path(model_name, model_version)
     
     def server_live(self) -> bool:
         """Check if server is live (KServe v2)"""
         response = self.session.get(
-            f"{self.base_url}/v2/health/live",
+            self._live_url,
             timeout=self.timeout
         )
         response.raise_for_status()
-        return response.json().get("live", False)
+        return orjson.loads(response.content).get("live", False)
     
     def server_ready(self) -> bool:
         """Check if server is ready (KServe v2)"""
         response = self.session.get(
-            f"{self.base_url}/v2/health/ready",
+            self._ready_url,
             timeout=self.timeout
         )
         response.raise_for_status()
-        return response.json().get("ready", False)
+        return orjson.loads(response.content).get("ready", False)
+    
+    def _compress(self, body: bytes,
+                  headers: Optional[Dict[str, str]]) -> Tuple[bytes, Optional[Dict[str, str]]]:
+        """Gzip a large request body if the server accepts compressed requests"""
+        if self.compress_threshold is None or len(body) <= self.compress_threshold:
+            return body, headers
+        if self._gzip_accepted is None and time.monotonic() >= self._gzip_probe_after:
+            self._probe_gzip()
+        if not self._gzip_accepted:
+            return body, headers
+        return _gzip_request(body, headers)
+    
+    def _probe_gzip(self):
+        """Ask the readiness endpoint whether gzip request bodies are accepted"""
+        try:
+            response = self.session.get(self._ready_url, timeout=self.timeout)
+        except requests.RequestException:
+            response = None
+        if response is not None and 200 <= response.status_code < 300:
+            self._gzip_accepted = _accepts_gzip(response.headers)
+        else:
+            self._gzip_probe_after = time.monotonic() + GZIP_PROBE_COOLDOWN
     
     def model_ready(self, model_name: str, model_version: Optional[str] = None) -> bool:
         """Check if model is ready (KServe v2)"""
-        url = f"{self.base_url}/v2/models/{model_name}/ready"
-        if model_version:
-            url = f"{self.base_url}/v2/models/{model_name}/versions/{model_version}/ready"
-            
-        response = self.session.get(url, timeout=self.timeout)
+        response = self.session.get(self._model_url(model_name, model_version) + "/ready",
+                                    timeout=self.timeout)
         response.raise_for_status()
-        return response.json().get("ready", False)
+        return orjson.loads(response.content).get("ready", False)
     
     def list_models(self) -> List[str]:
         """List available models (KServe v2)"""
         response = self.session.get(
-            f"{self.base_url}/v2/models",
+            self._models_url,
             timeout=self.timeout
         )
         response.raise_for_status()
-        return response.json()
+        return orjson.loads(response.content)["models"]
     
     def model_metadata(self, model_name: str, model_version: Optional[str] = None) -> ModelMetadata:
         """Get model metadata (KServe v2)"""
-        url = f"{self.base_url}/v2/models/{model_name}"
-        if model_version:
-            url = f"{self.base_url}/v2/models/{model_name}/versions/{model_version}"
-            
-        response = self.session.get(url, timeout=self.timeout)
+        response = self.session.get(self._model_url(model_name, model_version),
+                                    timeout=self.timeout)
         response.raise_for_status()
-        data = response.json()
-        
-        # Convert tensor metadata
-        inputs = [TensorMetadata(**inp) for inp in data.get("inputs", [])]
-        outputs = [TensorMetadata(**out) for out in data.get("outputs", [])]
-        
-        return ModelMetadata(
-            name=data["name"],
-            versions=data.get("versions", []),
-            platform=data.get("platform", "RxInfer.jl"),
-            inputs=inputs,
-            outputs=outputs
-        )
+        return _model_metadata_from_json(orjson.loads(response.content))
     
     def infer(self, model_name: str, 
               inputs: List[Dict[str, Any]],
               model_version: Optional[str] = None,
               outputs: Optional[List[Dict[str, Any]]] = None,
               parameters: Optional[Dict[str, Any]] = None,
-              request_id: Optional[str] = None) -> InferenceResponse:
-        """Run inference on a model (KServe v2)"""
-        url = f"{self.base_url}/v2/models/{model_name}/infer"
-        if model_version:
-            url = f"{self.base_url}/v2/models/{model_name}/versions/{model_version}/infer"
+              request_id: Optional[str] = None,
+              binary_data: bool = False) -> InferenceResponse:
+        """Run inference on a model (KServe v2)
         
-        request_data = InferenceRequest(
-            id=request_id or str(uuid4()),
-            inputs=inputs,
+        Input data may be lists or numpy arrays. With ``binary_data=True``,
+        numeric inputs are sent as raw little-endian bytes using the KServe
+        binary tensor extension instead of JSON numbers, and numeric outputs
+        come back the same way, decoded into flat ``array.array`` data.
+        """
+        return InferenceResponse(**self.infer_raw(
+            model_name,
+            inputs,
+            model_version=model_version,
             outputs=outputs,
-            parameters=parameters
+            parameters=parameters,
+            request_id=request_id,
+            binary_data=binary_data
+        ))
+    
+    def infer_raw(self, model_name: str, 
+                  inputs: List[Dict[str, Any]],
+                  model_version: Optional[str] = None,
+                  outputs: Optional[List[Dict[str, Any]]] = None,
+                  parameters: Optional[Dict[str, Any]] = None,
+                  request_id: Optional[str] = None,
+                  binary_data: bool = False) -> Dict[str, Any]:
+        """Run inference and return the decoded response dict (KServe v2)
+        
+        Same as ``infer`` but skips building and validating an
+        ``InferenceResponse``, which saves per-call overhead in tight
+        loops against a trusted server. Missing or malformed fields are
+        not reported; callers get the server's JSON as-is.
+        """
+        url = self._model_url(model_name, model_version) + "/infer"
+        if self._batcher is not None and not binary_data:
+            return self._batcher.submit(
+                url + ":batch",
+                _infer_payload(inputs, outputs, parameters, request_id)
+            )
+        
+        body, headers = self._compress(*_encode_infer_request(
+            inputs, outputs, parameters, request_id, binary_data
+        ))
+        
+        # Stream the body and read it in one call rather than through
+        # response.content's chunk list, which peaks at twice the body size
+        response = self.session.post(
+            url,
+            data=body,
+            headers=headers,
+            timeout=self.timeout,
+            stream=True
         )
+        with response:
+            response.raise_for_status()
+            return _decode_infer_response(
+                response.raw.read(decode_content=True),
+                response.headers.get("Inference-Header-Content-Length")
+            )
+    
+    def infer_stream(self, model_name: str,
+                     inputs: List[Dict[str, Any]],
+                     model_version: Optional[str] = None,
+                     outputs: Optional[List[Dict[str, Any]]] = None,
+                     parameters: Optional[Dict[str, Any]] = None,
+                     request_id: Optional[str] = None,
+                     binary_data: bool = False) -> Iterator[Dict[str, Any]]:
+        """Run inference and yield output tensors as they are parsed (KServe v2)
+        
+        The response is parsed incrementally, so only one output tensor is
+        held in memory at a time. Use this for responses with large
+        posteriors; the connection is returned to the pool once the
+        generator is exhausted or closed. Outputs are always requested as
+        JSON, even with ``binary_data=True``.
+        """
+        url = self._model_url(model_name, model_version) + "/infer"
+        body, headers = self._compress(*_encode_infer_request(
+            inputs, outputs, parameters, request_id, binary_data,
+            binary_output=False
+        ))
         
         response = self.session.post(
             url,
-            json=request_data.model_dump(exclude_none=True),
+            data=body,
+            headers=headers,
+            timeout=self.timeout,
+            stream=True
+        )
+        with response:
+            response.raise_for_status()
+            response.raw.decode_content = True
+            yield from ijson.items(response.raw, "outputs.item", use_float=True)
+    
+    def _send_batch(self, url: str,
+                    payloads: List[Dict[str, Any]]) -> List[Union[Dict[str, Any], Exception]]:
+        """POST one infer:batch request and split its results"""
+        body, headers = self._compress(_encode_batch_request(payloads), None)
+        response = self.session.post(
+            url,
+            data=body,
+            headers=headers,
             timeout=self.timeout
         )
         response.raise_for_status()
-        return InferenceResponse(**response.json())
+        return _decode_batch_response(response.content)
     
     def infer_simple(self, model_name: str, 
                     data: Dict[str, Any],
@@ -150,78 +715,379 @@ class RxInferClient:
                     parameters: Optional[Dict[str, Any]] = None,
                     request_id: Optional[str] = None) -> InferenceResponse:
         """Simplified inference for single data dict (convenience method)"""
-        # Convert simple data dict to KServe tensor format
-        inputs = []
-        for name, value in data.items():
-            if isinstance(value, list):
-                inputs.append({
-                    "name": name,
-                    "datatype": "FP64",  # Default to float64
-                    "shape": [len(value)],
-                    "data": value
-                })
-            elif isinstance(value, (int, float)):
-                inputs.append({
-                    "name": name,
-                    "datatype": "FP64",
-                    "shape": [1],
-                    "data": [value]
-                })
-            else:
-                # Convert to JSON string for complex types
-                inputs.append({
-                    "name": name,
-                    "datatype": "BYTES",
-                    "shape": [1],
-                    "data": [json.dumps(value)]
-                })
-        
         return self.infer(
             model_name=model_name,
-            inputs=inputs,
+            inputs=_simple_inputs(data),
             model_version=model_version,
             parameters=parameters,
             request_id=request_id
         )
     
+    def batch_infer(self, jobs: List[Tuple[str, List[Dict[str, Any]]]],
+                    max_concurrency: int = 10,
+                    parameters: Optional[Dict[str, Any]] = None,
+                    binary_data: bool = False) -> List[Union[InferenceResponse, Exception]]:
+        """Run many inferences concurrently over the pooled session
+        
+        ``jobs`` holds ``(model_name, inputs)`` pairs. Results come back in
+        input order; a job that fails yields its exception instead of a
+        response, so one bad request does not discard the rest.
+        """
+        def run(job):
+            model_name, inputs = job
+            try:
+                return self.infer(
+                    model_name, inputs,
+                    parameters=parameters,
+                    binary_data=binary_data
+                )
+            except Exception as e:
+                return e
+        
+        with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+            return list(executor.map(run, jobs))
+    
     def __enter__(self):
         return self
     
-    def __exit__(self, exc_type, exc_val, exc_tb):
+    def close(self):
+        """Close the session; requests still waiting for a batch fail"""
+        if self._batcher is not None:
+            self._batcher.close()
         self.session.close()
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+class AsyncRxInferClient:
+    """Asyncio client for RxInferKServe (KServe v2 compatible)
+    
+    Mirrors ``RxInferClient`` with ``async`` methods on an ``httpx.AsyncClient``,
+    so many inferences can run concurrently with ``asyncio.gather``. Requests
+    are multiplexed over HTTP/2 when the server supports it; the keep-alive
+    limit bounds how many idle connections are held open for reuse.
+    """
+    
+    def __init__(self, base_url: str = "http://localhost:8080",
+                 api_key: Optional[str] = None,
+                 timeout: int = 30,
+                 max_connections: int = 100,
+                 max_keepalive_connections: int = 20,
+                 retries: int = 3,
+                 backoff_base: float = 0.5,
+                 backoff_max: float = 30.0,
+                 batching: bool = False,
+                 max_batch: int = 32,
+                 batch_timeout_ms: float = 5,
+                 compress_threshold: Optional[int] = COMPRESS_MIN_BYTES):
+        self.base_url = base_url.rstrip('/')
+        self.api_key = api_key
+        self.timeout = timeout
+        self.retries = retries
+        self.compress_threshold = compress_threshold
+        self._gzip_accepted: Optional[bool] = None
+        self._gzip_probe_after = 0.0
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self._batcher = (
+            _AsyncBatchQueue(self._send_batch, max_batch, batch_timeout_ms / 1000)
+            if batching else None
+        )
+        
+        headers = {
+            "Content-Type": "application/json",
+            "Accept": "application/json"
+        }
+        if api_key:
+            headers["X-API-Key"] = api_key
+        
+        self._client = httpx.AsyncClient(
+            base_url=self.base_url,
+            http2=True,
+            timeout=timeout,
+            headers=headers,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections
+            )
+        )
+    
+    async def _retry(
+        self, request: Callable[[], Awaitable[httpx.Response]]
+    ) -> httpx.Response:
+        """Await ``request()``, retrying transient failures
+        
+        Connection failures and ``RETRY_STATUS_CODES`` responses (the same
+        POST-safe set as the sync client) are retried up to ``retries`` times
+        with exponential backoff and jitter; the last response is returned
+        as-is for the caller's ``raise_for_status``. Errors after the request
+        was sent are not retried, as the server may already have run it.
+        """
+        for attempt in range(self.retries + 1):
+            try:
+                response = await request()
+            except (httpx.ConnectError, httpx.ConnectTimeout):
+                if attempt == self.retries:
+                    raise
+            else:
+                if (response.status_code not in RETRY_STATUS_CODES
+                        or attempt == self.retries):
+                    return response
+            
+            delay = min(self.backoff_base * 2 ** attempt, self.backoff_max)
+            await asyncio.sleep(delay * (1 - 0.25 * random.random()))
+    
+    async def server_live(self) -> bool:
+        """Check if server is live (KServe v2)"""
+        response = await self._retry(lambda: self._client.get("/v2/health/live"))
+        response.raise_for_status()
+        return orjson.loads(response.content).get("live", False)
+    
+    async def server_ready(self) -> bool:
+        """Check if server is ready (KServe v2)"""
+        response = await self._retry(lambda: self._client.get("/v2/health/ready"))
+        response.raise_for_status()
+        return orjson.loads(response.content).get("ready", False)
+    
+    async def _compress(self, body: bytes,
+                        headers: Optional[Dict[str, str]]) -> Tuple[bytes, Optional[Dict[str, str]]]:
+        """Gzip a large request body if the server accepts compressed requests"""
+        if self.compress_threshold is None or len(body) <= self.compress_threshold:
+            return body, headers
+        if self._gzip_accepted is None and time.monotonic() >= self._gzip_probe_after:
+            await self._probe_gzip()
+        if not self._gzip_accepted:
+            return body, headers
+        return _gzip_request(body, headers)
+    
+    async def _probe_gzip(self):
+        """Ask the readiness endpoint whether gzip request bodies are accepted"""
+        try:
+            response = await self._client.get("/v2/health/ready")
+        except httpx.HTTPError:
+            response = None
+        if response is not None and response.is_success:
+            self._gzip_accepted = _accepts_gzip(response.headers)
+        else:
+            self._gzip_probe_after = time.monotonic() + GZIP_PROBE_COOLDOWN
+    
+    async def model_ready(self, model_name: str,
+                          model_version: Optional[str] = None) -> bool:
+        """Check if model is ready (KServe v2)"""
+        url = f"{_model_path(model_name, model_version)}/ready"
+        response = await self._retry(lambda: self._client.get(url))
+        response.raise_for_status()
+        return orjson.loads(response.content).get("ready", False)
+    
+    async def list_models(self) -> List[str]:
+        """List available models (KServe v2)"""
+        response = await self._retry(lambda: self._client.get("/v2/models"))
+        response.raise_for_status()
+        return orjson.loads(response.content)["models"]
+    
+    async def model_metadata(self, model_name: str,
+                             model_version: Optional[str] = None) -> ModelMetadata:
+        """Get model metadata (KServe v2)"""
+        url = _model_path(model_name, model_version)
+        response = await self._retry(lambda: self._client.get(url))
+        response.raise_for_status()
+        return _model_metadata_from_json(orjson.loads(response.content))
+    
+    async def infer(self, model_name: str,
+                    inputs: List[Dict[str, Any]],
+                    model_version: Optional[str] = None,
+                    outputs: Optional[List[Dict[str, Any]]] = None,
+                    parameters: Optional[Dict[str, Any]] = None,
+                    request_id: Optional[str] = None,
+                    binary_data: bool = False) -> InferenceResponse:
+        """Run inference on a model (KServe v2)"""
+        return InferenceResponse(**await self.infer_raw(
+            model_name,
+            inputs,
+            model_version=model_version,
+            outputs=outputs,
+            parameters=parameters,
+            request_id=request_id,
+            binary_data=binary_data
+        ))
+    
+    async def infer_raw(self, model_name: str,
+                        inputs: List[Dict[str, Any]],
+                        model_version: Optional[str] = None,
+                        outputs: Optional[List[Dict[str, Any]]] = None,
+                        parameters: Optional[Dict[str, Any]] = None,
+                        request_id: Optional[str] = None,
+                        binary_data: bool = False) -> Dict[str, Any]:
+        """Run inference and return the decoded response dict (KServe v2)"""
+        url = f"{_model_path(model_name, model_version)}/infer"
+        if self._batcher is not None and not binary_data:
+            return await self._batcher.submit(
+                url + ":batch",
+                _infer_payload(inputs, outputs, parameters, request_id)
+            )
+        
+        body, headers = await self._compress(*_encode_infer_request(
+            inputs, outputs, parameters, request_id, binary_data
+        ))
+        response = await self._retry(lambda: self._client.post(
+            url,
+            content=body,
+            headers=headers
+        ))
+        response.raise_for_status()
+        return _decode_infer_response(
+            response.content,
+            response.headers.get("Inference-Header-Content-Length")
+        )
+    
+    async def _send_batch(self, url: str,
+                          payloads: List[Dict[str, Any]]) -> List[Union[Dict[str, Any], Exception]]:
+        """POST one infer:batch request and split its results"""
+        body, headers = await self._compress(_encode_batch_request(payloads), None)
+        response = await self._retry(lambda: self._client.post(
+            url,
+            content=body,
+            headers=headers
+        ))
+        response.raise_for_status()
+        return _decode_batch_response(response.content)
+    
+    async def infer_simple(self, model_name: str,
+                           data: Dict[str, Any],
+                           model_version: Optional[str] = None,
+                           parameters: Optional[Dict[str, Any]] = None,
+                           request_id: Optional[str] = None) -> InferenceResponse:
+        """Simplified inference for single data dict (convenience method)"""
+        return await self.infer(
+            model_name=model_name,
+            inputs=_simple_inputs(data),
+            model_version=model_version,
+            parameters=parameters,
+            request_id=request_id
+        )
+    
+    async def batch_infer(self, jobs: List[Tuple[str, List[Dict[str, Any]]]],
+                          max_concurrency: int = 10,
+                          parameters: Optional[Dict[str, Any]] = None,
+                          binary_data: bool = False) -> List[Union[InferenceResponse, BaseException]]:
+        """Run many inferences concurrently, at most ``max_concurrency`` at once
+        
+        ``jobs`` holds ``(model_name, inputs)`` pairs. Results come back in
+        input order; a job that fails yields its exception instead of a
+        response.
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        async def run(job):
+            model_name, inputs = job
+            async with semaphore:
+                return await self.infer(
+                    model_name, inputs,
+                    parameters=parameters,
+                    binary_data=binary_data
+                )
+        
+        return await asyncio.gather(*(run(job) for job in jobs), return_exceptions=True)
+    
+    async def aclose(self):
+        await self._client.aclose()
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.aclose()
+
+
+@functools.lru_cache(maxsize=16)
+def default_client(base_url: str = "http://localhost:8080",
+                   api_key: Optional[str] = None,
+                   timeout: int = 30) -> RxInferClient:
+    """Shared client for scripts, created once per (base_url, api_key, timeout)
+    
+    Repeated calls reuse the same session and its pooled connections instead
+    of paying connection setup for every new ``RxInferClient``.
+    """
+    return RxInferClient(base_url, api_key, timeout)
+
+
+# Module-level shortcuts on the default client
+def server_live() -> bool:
+    return default_client().server_live()
+
+
+def server_ready() -> bool:
+    return default_client().server_ready()
+
+
+def list_models() -> List[str]:
+    return default_client().list_models()
+
+
+def model_metadata(model_name: str, model_version: Optional[str] = None) -> ModelMetadata:
+    return default_client().model_metadata(model_name, model_version)
+
+
+def infer_simple(model_name: str, data: Dict[str, Any], **kwargs: Any) -> InferenceResponse:
+    return default_client().infer_simple(model_name, data, **kwargs)
 
 
 # Convenience functions for working with distributions
+def _parse_normal(params: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "type": "normal",
+        "mean": params.get("mean", 0.0),
+        "std": params.get("std", 1.0)
+    }
+
+
+def _parse_beta(params: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "type": "beta",
+        "alpha": params.get("alpha", 1.0),
+        "beta": params.get("beta", 1.0)
+    }
+
+
+# Parsers by distribution name; add more distribution types as needed
+_DIST_PARSERS: Dict[str, Callable[[Dict[str, Any]], Dict[str, Any]]] = {
+    "Normal": _parse_normal,
+    "Beta": _parse_beta,
+}
+
+
+@functools.lru_cache(maxsize=256)
+def _dist_parser(dist_type: str) -> Optional[Callable[[Dict[str, Any]], Dict[str, Any]]]:
+    """Parser for a serialized type name such as ``Distributions.Normal{Float64}``
+    
+    Names that are not an exact key (e.g. ``NormalMeanVariance``) fall back
+    to matching any known name they contain; the result is cached per type.
+    """
+    short = dist_type.rsplit(".", 1)[-1].split("{", 1)[0]
+    parser = _DIST_PARSERS.get(short)
+    if parser is None:
+        parser = next(
+            (p for name, p in _DIST_PARSERS.items() if name in dist_type), None
+        )
+    return parser
+
+
 def parse_distribution(dist_dict: Dict[str, Any]) -> Dict[str, Any]:
     """Parse a serialized distribution"""
     if not isinstance(dist_dict, dict) or "type" not in dist_dict:
         return dist_dict
     
-    dist_type = dist_dict["type"]
-    params = dist_dict.get("parameters", {})
-    
-    # Add parsing logic for specific distribution types
-    if "Normal" in dist_type:
-        return {
-            "type": "normal",
-            "mean": params.get("mean", 0.0),
-            "std": params.get("std", 1.0)
-        }
-    elif "Beta" in dist_type:
-        return {
-            "type": "beta",
-            "alpha": params.get("alpha", 1.0),
-            "beta": params.get("beta", 1.0)
-        }
-    # Add more distribution types as needed
-    
-    return dist_dict
+    parser = _dist_parser(dist_dict["type"])
+    if parser is None:
+        return dist_dict
+    return parser(dist_dict.get("parameters", {}))
 
 
 # Example usage
 if __name__ == "__main__":
-    # Create client
-    client = RxInferClient()
+    # Shared client (pooled connections are reused across calls)
+    client = default_client()
     
     # Check server status
     live = client.server_live()
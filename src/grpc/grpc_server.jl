@@ -111,8 +111,18 @@ function handle_model_infer(request::ModelInferRequest)
         # Convert tensor inputs to RxInfer format
         data_dict = Dict{String,Any}()
 
-        for input in request.inputs
-            if !isnothing(input.contents)
+        # Inputs are sent either as typed contents or as raw_input_contents,
+        # which the protocol requires to be used for all inputs or none
+        use_raw = !isempty(request.raw_input_contents)
+        if use_raw && length(request.raw_input_contents) != length(request.inputs)
+            throw(ArgumentError("raw_input_contents must have one entry per input"))
+        end
+
+        for (i, input) in enumerate(request.inputs)
+            if use_raw
+                data_dict[input.name] =
+                    convert_from_raw_tensor(input.datatype, request.raw_input_contents[i])
+            elseif !isnothing(input.contents)
                 data = convert_from_kserve_tensor(input.contents)
                 data_dict[input.name] = data
             end
@@ -165,19 +175,31 @@ function handle_model_infer(request::ModelInferRequest)
 
         # Handle free energy
         if haskey(results, :free_energy)
-            fe_contents = convert_to_kserve_tensor("free_energy", [results[:free_energy]])
+            free_energy = collect(Float64, vcat(results[:free_energy]))
+            fe_contents = convert_to_kserve_tensor("free_energy", free_energy)
             push!(
                 outputs,
                 InferOutputTensor(
                     "free_energy",
                     "FP64",
-                    [1],
+                    [length(free_energy)],
                     Dict{String,InferParameter}(),
                     fe_contents,
                 ),
             )
         end
 
+        # Clients that send raw inputs also get raw outputs, which they can
+        # decode without walking the typed repeated fields
+        raw_outputs = Vector{Vector{UInt8}}()
+        if use_raw
+            raw_outputs = [convert_to_raw_tensor(o.datatype, o.contents) for o in outputs]
+            outputs = [
+                InferOutputTensor(o.name, o.datatype, o.shape, o.parameters, nothing)
+                for o in outputs
+            ]
+        end
+
         # Create response
         ModelInferResponse(
             request.model_name,
@@ -188,7 +210,7 @@ function handle_model_infer(request::ModelInferRequest)
                     InferParameter(ProtoBuf.OneOf(:int64_param, round(Int64, duration_ms))),
             ),
             outputs,
-            Vector{Vector{UInt8}}(),
+            raw_outputs,
         )
 
     finally
@@ -242,7 +264,13 @@ function handle_grpc_request(request::HTTP.Request)
             req = PB.decode(PB.ProtoDecoder(IOBuffer(request.body)), ModelInferRequest)
             handle_model_infer(req)
         else
-            throw(ArgumentError("Unknown method: $method_name"))
+            # Includes streaming RPCs, which this request/response handler
+            # cannot serve
+            return HTTP.Response(
+                200,
+                ["grpc-status" => "12", "grpc-message" => "Method not implemented"],
+                "",
+            )
         end
 
         # Encode response
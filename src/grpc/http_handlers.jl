@@ -18,7 +18,7 @@ using ...Serialization: serialize_inference_results, deserialize_inference_data
 
 export handle_v2_health_live, handle_v2_health_ready
 export handle_v2_model_ready, handle_v2_models_list
-export handle_v2_model_metadata, handle_v2_model_infer
+export handle_v2_model_metadata, handle_v2_model_infer, handle_v2_model_infer_batch
 export route_v2_request
 
 # Server liveness endpoint - GET /v2/health/live
@@ -125,6 +125,214 @@ function handle_v2_model_metadata(
     return HTTP.Response(200, ["Content-Type" => "application/json"], JSON3.write(response))
 end
 
+# Parse an inference request body. With the binary tensor extension the body is a
+# JSON header of `Inference-Header-Content-Length` bytes followed by the raw data of
+# each input that declares a `binary_data_size` parameter, in input order.
+function parse_infer_body(request::HTTP.Request)
+    header_length = HTTP.header(request, "Inference-Header-Content-Length", "")
+    if isempty(header_length)
+        return JSON3.read(request.body, Dict{String,Any})
+    end
+
+    json_length = parse(Int, header_length)
+    body = JSON3.read(String(request.body[1:json_length]), Dict{String,Any})
+
+    offset = json_length
+    for input in get(body, "inputs", [])
+        params = get(input, "parameters", nothing)
+        if isnothing(params) || !haskey(params, "binary_data_size")
+            continue
+        end
+        nbytes = Int(params["binary_data_size"])
+        if offset + nbytes > length(request.body)
+            throw(ArgumentError("Binary data for input $(input["name"]) is truncated"))
+        end
+        input["data"] =
+            convert_from_raw_tensor(input["datatype"], request.body[offset+1:offset+nbytes])
+        offset += nbytes
+    end
+
+    return body
+end
+
+# REST output tensor for an extra inference result. Numbers and real arrays are
+# numeric tensors; anything else is sent as a JSON-encoded BYTES tensor, like the
+# posteriors, or skipped (nothing) if it cannot be written as JSON. KServe v2
+# data is flattened in row-major order, so arrays are reversed across
+# dimensions before vec (vectors are sent as-is, without a copy).
+row_major(value::AbstractVector) = value
+row_major(value::AbstractArray) = vec(permutedims(value, ndims(value):-1:1))
+
+# Inverse of row_major: the Julia array for flat row-major tensor data and shape
+function from_row_major(data::AbstractVector, shape)
+    length(shape) > 1 || return data
+    return permutedims(reshape(data, reverse(Tuple(shape))), length(shape):-1:1)
+end
+
+rest_output_tensor(name, value::Number) =
+    Dict("name" => name, "datatype" => "FP64", "shape" => [1], "data" => [value])
+rest_output_tensor(name, value::AbstractArray{<:Real}) = Dict(
+    "name" => name,
+    "datatype" => tensor_datatype(eltype(value)),
+    "shape" => tensor_shape(value),
+    "data" => row_major(value),
+)
+function rest_output_tensor(name, value)
+    json = try
+        JSON3.write(value)
+    catch
+        return nothing
+    end
+    return Dict("name" => name, "datatype" => "BYTES", "shape" => [1], "data" => [json])
+end
+
+# Run one parsed KServe v2 inference request against a model and return the
+# response body. Throws if the inference fails.
+function run_v2_inference(
+    body::AbstractDict,
+    model_name::String,
+    model_version::Union{String,Nothing},
+)
+    # Extract request parameters
+    request_id = get(body, "id", string(uuid4()))
+    parameters = get(body, "parameters", Dict{String,Any}())
+    inputs = get(body, "inputs", [])
+
+    # Create a temporary model instance for this inference
+    instance = create_model_instance(model_name)
+
+    try
+        # Convert KServe tensor inputs to RxInfer data format
+        data_dict = Dict{String,Any}()
+
+        for input in inputs
+            name = input["name"]
+            datatype = input["datatype"]
+            shape = input["shape"]
+            data = input["data"]
+
+            # Reshape flat row-major data to its original shape
+            data_dict[name] = from_row_major(data, shape)
+        end
+
+        # Convert parameters to Symbol keys for RxInfer
+        symbol_params = Dict{Symbol,Any}()
+        for (k, v) in parameters
+            symbol_params[Symbol(k)] = v
+        end
+
+        # Run inference
+        results, duration_ms = infer(
+            instance.id,
+            deserialize_inference_data(data_dict);
+            iterations = get(parameters, "iterations", 10),
+            options = symbol_params,
+        )
+
+        # Serialize results to KServe v2 format
+        outputs = []
+
+        # First serialize the results to handle Symbol/String conversion
+        serialized_results = serialize_inference_results(results)
+
+        # Add posteriors as JSON-encoded BYTES
+        if haskey(serialized_results, "posteriors")
+            posteriors_json = JSON3.write(serialized_results["posteriors"])
+            push!(
+                outputs,
+                Dict(
+                    "name" => "posteriors",
+                    "datatype" => "BYTES",
+                    "shape" => [1],
+                    "data" => [posteriors_json],
+                ),
+            )
+        end
+
+        # Add free energy as FP64: a scalar, or one value per iteration
+        if haskey(serialized_results, "free_energy")
+            free_energy = collect(Float64, vcat(serialized_results["free_energy"]))
+            push!(
+                outputs,
+                Dict(
+                    "name" => "free_energy",
+                    "datatype" => "FP64",
+                    "shape" => [length(free_energy)],
+                    "data" => free_energy,
+                ),
+            )
+        end
+
+        # Add any other numeric results
+        for (key, value) in serialized_results
+            if key ∉ ["posteriors", "free_energy"]
+                tensor = rest_output_tensor(key, value)
+                isnothing(tensor) || push!(outputs, tensor)
+            end
+        end
+
+        # Create response
+        return Dict(
+            "model_name" => model_name,
+            "model_version" => something(model_version, "1.0.0"),
+            "id" => request_id,
+            "outputs" => outputs,
+            "parameters" => Dict("inference_time_ms" => duration_ms),
+        )
+
+    finally
+        # Clean up temporary instance
+        delete_model_instance(instance.id)
+    end
+end
+
+# Whether an inference request asks for any output in the binary tensor
+# extension, either for all outputs (`binary_data_output` request parameter) or
+# per requested output (its `binary_data` parameter)
+function wants_binary_output(body::AbstractDict)
+    parameters = something(get(body, "parameters", nothing), Dict{String,Any}())
+    get(parameters, "binary_data_output", false) == true && return true
+    return any(something(get(body, "outputs", nothing), [])) do output
+        params = something(get(output, "parameters", nothing), Dict{String,Any}())
+        get(params, "binary_data", false) == true
+    end
+end
+
+# Build a binary tensor extension response: the JSON header, whose numeric
+# outputs carry a `binary_data_size` parameter instead of `data`, followed by
+# the raw little-endian data of those outputs in output order. BYTES outputs
+# such as the JSON-encoded posteriors stay in the header.
+function binary_infer_response(response::AbstractDict, body::AbstractDict)
+    parameters = something(get(body, "parameters", nothing), Dict{String,Any}())
+    all_binary = get(parameters, "binary_data_output", false) == true
+    requested = Dict{String,Bool}()
+    for output in something(get(body, "outputs", nothing), [])
+        params = something(get(output, "parameters", nothing), Dict{String,Any}())
+        requested[output["name"]] = get(params, "binary_data", false) == true
+    end
+
+    chunks = Vector{UInt8}[]
+    for output in response["outputs"]
+        if output["datatype"] == "BYTES" || !get(requested, output["name"], all_binary)
+            continue
+        end
+        raw = convert_to_raw_tensor(output["datatype"], output["data"])
+        delete!(output, "data")
+        output["parameters"] = Dict("binary_data_size" => length(raw))
+        push!(chunks, raw)
+    end
+
+    header = JSON3.write(response)
+    return HTTP.Response(
+        200,
+        [
+            "Content-Type" => "application/octet-stream",
+            "Inference-Header-Content-Length" => string(sizeof(header)),
+        ],
+        vcat(Vector{UInt8}(header), chunks...),
+    )
+end
+
 # Model inference endpoint - POST /v2/models/{model_name}[/versions/{model_version}]/infer
 function handle_v2_model_infer(
     request::HTTP.Request,
@@ -132,13 +340,8 @@ function handle_v2_model_infer(
     model_version::Union{String,Nothing},
 )
     try
-        # Parse request body
-        body = JSON3.read(request.body, Dict{String,Any})
-
-        # Extract request parameters
-        request_id = get(body, "id", string(uuid4()))
-        parameters = get(body, "parameters", Dict{String,Any}())
-        inputs = get(body, "inputs", [])
+        # Parse request body (JSON, or JSON header plus binary tensor data)
+        body = parse_infer_body(request)
 
         # Check if model exists
         model = get_model(model_name)
@@ -150,111 +353,71 @@ function handle_v2_model_infer(
             )
         end
 
-        # Create a temporary model instance for this inference
-        instance = create_model_instance(model_name)
-
-        try
-            # Convert KServe tensor inputs to RxInfer data format
-            data_dict = Dict{String,Any}()
-
-            for input in inputs
-                name = input["name"]
-                datatype = input["datatype"]
-                shape = input["shape"]
-                data = input["data"]
-
-                # Reshape flat data to original shape
-                if length(shape) > 1
-                    data_dict[name] = reshape(data, tuple(shape...))
-                else
-                    data_dict[name] = data
-                end
-            end
-
-            # Convert parameters to Symbol keys for RxInfer
-            symbol_params = Dict{Symbol,Any}()
-            for (k, v) in parameters
-                symbol_params[Symbol(k)] = v
-            end
-
-            # Run inference
-            results, duration_ms = infer(
-                instance.id,
-                deserialize_inference_data(data_dict);
-                iterations = get(parameters, "iterations", 10),
-                options = symbol_params,
-            )
-
-            # Serialize results to KServe v2 format
-            outputs = []
-
-            # First serialize the results to handle Symbol/String conversion
-            serialized_results = serialize_inference_results(results)
-
-            # Add posteriors as JSON-encoded BYTES
-            if haskey(serialized_results, "posteriors")
-                posteriors_json = JSON3.write(serialized_results["posteriors"])
-                push!(
-                    outputs,
-                    Dict(
-                        "name" => "posteriors",
-                        "datatype" => "BYTES",
-                        "shape" => [1],
-                        "data" => [posteriors_json],
-                    ),
-                )
-            end
-
-            # Add free energy as FP64
-            if haskey(serialized_results, "free_energy")
-                push!(
-                    outputs,
-                    Dict(
-                        "name" => "free_energy",
-                        "datatype" => "FP64",
-                        "shape" => [1],
-                        "data" => [serialized_results["free_energy"]],
-                    ),
-                )
-            end
+        response = run_v2_inference(body, model_name, model_version)
+        if wants_binary_output(body)
+            return binary_infer_response(response, body)
+        end
+        return HTTP.Response(
+            200,
+            ["Content-Type" => "application/json"],
+            JSON3.write(response),
+        )
 
-            # Add any other numeric results
-            for (key, value) in serialized_results
-                if key ∉ ["posteriors", "free_energy"] && value isa Number
-                    push!(
-                        outputs,
-                        Dict(
-                            "name" => key,
-                            "datatype" => "FP64",
-                            "shape" => [1],
-                            "data" => [value],
-                        ),
-                    )
-                end
-            end
+    catch e
+        @error "Inference failed" exception=(e, catch_backtrace())
+        return HTTP.Response(
+            500,
+            ["Content-Type" => "application/json"],
+            JSON3.write(Dict("error" => "Inference failed: $(sprint(showerror, e))")),
+        )
+    end
+end
 
-            # Create response
-            response = Dict(
-                "model_name" => model_name,
-                "model_version" => something(model_version, "1.0.0"),
-                "id" => request_id,
-                "outputs" => outputs,
-                "parameters" => Dict("inference_time_ms" => duration_ms),
-            )
+# Batched inference endpoint -
+# POST /v2/models/{model_name}[/versions/{model_version}]/infer:batch
+#
+# The body is {"requests": [<infer request>, ...]} and the response is
+# {"responses": [...]} in the same order. Each entry is either a regular
+# inference response or {"error": message, "status": code}, so one failing
+# request does not fail the rest of the batch.
+function handle_v2_model_infer_batch(
+    request::HTTP.Request,
+    model_name::String,
+    model_version::Union{String,Nothing},
+)
+    try
+        body = JSON3.read(request.body, Dict{String,Any})
 
+        # Check if model exists
+        model = get_model(model_name)
+        if isnothing(model)
             return HTTP.Response(
-                200,
+                404,
                 ["Content-Type" => "application/json"],
-                JSON3.write(response),
+                JSON3.write(Dict("error" => "Model not found: $model_name")),
             )
+        end
 
-        finally
-            # Clean up temporary instance
-            delete_model_instance(instance.id)
+        responses = map(get(body, "requests", [])) do item
+            try
+                run_v2_inference(item, model_name, model_version)
+            catch e
+                @error "Batched inference failed" exception=(e, catch_backtrace())
+                Dict(
+                    "error" => "Inference failed: $(sprint(showerror, e))",
+                    "status" => 500,
+                )
+            end
         end
 
+        return HTTP.Response(
+            200,
+            ["Content-Type" => "application/json"],
+            JSON3.write(Dict("responses" => responses)),
+        )
+
     catch e
-        @error "Inference failed" exception=(e, catch_backtrace())
+        @error "Batch inference failed" exception=(e, catch_backtrace())
         return HTTP.Response(
             500,
             ["Content-Type" => "application/json"],
@@ -329,6 +492,14 @@ function route_v2_request(request::HTTP.Request)
                     model_name,
                     model_version,
                 )
+            elseif length(remaining_parts) == 1 &&
+                   remaining_parts[1] == "infer:batch" &&
+                   method == "POST"
+                return KServeV2HTTPHandlers.handle_v2_model_infer_batch(
+                    request,
+                    model_name,
+                    model_version,
+                )
             end
         end
     end
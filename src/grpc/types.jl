@@ -16,6 +16,7 @@ using ..kserve.v2: ServerMetadataRequest, ServerMetadataResponse
 export InferenceRequest, InferenceResponse
 export MetadataRequest, MetadataResponse
 export convert_to_kserve_tensor, convert_from_kserve_tensor
+export convert_from_raw_tensor, convert_to_raw_tensor
 export tensor_datatype, tensor_shape
 
 # Re-export protobuf types
@@ -215,6 +216,39 @@ function convert_from_kserve_tensor(tensor::InferTensorContents)
     return flat_data
 end
 
+# Convert raw little-endian tensor bytes (raw_input_contents) to a Julia array
+function convert_from_raw_tensor(datatype::AbstractString, raw::Vector{UInt8})
+    T = get(DATATYPE_MAP, datatype, nothing)
+    if isnothing(T) || !isbitstype(T)
+        throw(ArgumentError("Unsupported raw tensor datatype: $datatype"))
+    end
+
+    # Return the flat data (shape information is in the parent InferInputTensor)
+    return ltoh.(reinterpret(T, raw))
+end
+
+# Convert flat tensor data to raw little-endian bytes. BYTES elements are each
+# prefixed with their 4-byte little-endian length.
+function convert_to_raw_tensor(datatype::AbstractString, flat_data::AbstractVector)
+    if datatype == "BYTES"
+        io = IOBuffer()
+        for element in flat_data
+            write(io, htol(UInt32(sizeof(element))), element)
+        end
+        return take!(io)
+    end
+
+    T = get(DATATYPE_MAP, datatype, nothing)
+    if isnothing(T) || !isbitstype(T)
+        throw(ArgumentError("Unsupported raw tensor datatype: $datatype"))
+    end
+    return collect(reinterpret(UInt8, htol.(convert(Vector{T}, flat_data))))
+end
+
+# Convert typed tensor contents to raw little-endian bytes (raw_output_contents)
+convert_to_raw_tensor(datatype::AbstractString, contents::InferTensorContents) =
+    convert_to_raw_tensor(datatype, convert_from_kserve_tensor(contents))
+
 # Convert REST JSON request to protobuf types
 function json_to_protobuf_request(
     json_req::InferenceRequest,
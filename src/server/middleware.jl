@@ -3,6 +3,7 @@
 using HTTP
 using JSON3
 using Dates
+using CodecZlib
 
 # Logging middleware
 function logging_middleware(handler)
@@ -161,10 +162,77 @@ function size_limit_middleware(handler)
     end
 end
 
+# Request body decompression middleware. Clients may gzip large request bodies
+# (Content-Encoding: gzip); every response advertises that with
+# Accept-Encoding (RFC 7694). The decompressed size is capped at
+# max_request_size so a small compressed body cannot expand without bound.
+function decompression_middleware(handler)
+    return function (request::HTTP.Request)
+        encoding = lowercase(HTTP.header(request, "Content-Encoding", "identity"))
+
+        if encoding == "gzip"
+            config = get_config()
+            body = try
+                read(
+                    GzipDecompressorStream(IOBuffer(request.body)),
+                    config.max_request_size + 1,
+                )
+            catch e
+                return HTTP.Response(
+                    400,
+                    ["Content-Type" => "application/json", "Accept-Encoding" => "gzip"],
+                    JSON3.write(
+                        Dict(
+                            "error" => "invalid_encoding",
+                            "message" => "Request body is not valid gzip data",
+                            "timestamp" => now(),
+                        ),
+                    ),
+                )
+            end
+
+            if length(body) > config.max_request_size
+                return HTTP.Response(
+                    413,
+                    ["Content-Type" => "application/json", "Accept-Encoding" => "gzip"],
+                    JSON3.write(
+                        Dict(
+                            "error" => "payload_too_large",
+                            "message" => "Decompressed request body exceeds maximum size of $(config.max_request_size) bytes",
+                            "timestamp" => now(),
+                        ),
+                    ),
+                )
+            end
+
+            request.body = body
+            HTTP.removeheader(request, "Content-Encoding")
+            HTTP.setheader(request, "Content-Length" => string(length(body)))
+        elseif encoding != "identity"
+            return HTTP.Response(
+                415,
+                ["Content-Type" => "application/json", "Accept-Encoding" => "gzip"],
+                JSON3.write(
+                    Dict(
+                        "error" => "unsupported_encoding",
+                        "message" => "Unsupported Content-Encoding: $encoding",
+                        "timestamp" => now(),
+                    ),
+                ),
+            )
+        end
+
+        response = handler(request)
+        HTTP.setheader(response, "Accept-Encoding" => "gzip")
+        return response
+    end
+end
+
 # Compose all middleware
 function create_middleware_stack(handler)
     return handler |>
            error_middleware |>
+           decompression_middleware |>
            auth_middleware |>
            size_limit_middleware |>
            cors_middleware |>
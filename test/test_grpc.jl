@@ -12,6 +12,7 @@ const InferRequestedOutputTensor =
     RxInferKServe.KServeV2.kserve.v2.var"ModelInferRequest.InferRequestedOutputTensor"
 using ProtoBuf
 using JSON3
+using HTTP
 
 @testset "gRPC Server and Client" begin
     # Start server with gRPC enabled
@@ -115,6 +116,49 @@ using JSON3
             @test !isnothing(posterior_output)
         end
 
+        @testset "gRPC Inference with raw_input_contents" begin
+            y = [1.0, 0.0, 1.0, 1.0, 0.0]
+            raw = collect(reinterpret(UInt8, htol.(y)))
+            @test KServeV2Types.convert_from_raw_tensor("FP64", raw) == y
+            @test_throws ArgumentError KServeV2Types.convert_from_raw_tensor("BYTES", raw)
+
+            input_tensor =
+                RxInferKServe.KServeV2.kserve.v2.var"ModelInferRequest.InferInputTensor"(
+                    "y",                    # name
+                    "FP64",                 # datatype
+                    [5],                    # shape
+                    Dict{String,InferParameter}(),  # parameters
+                    nothing,                # contents (sent as raw bytes)
+                )
+
+            request = ModelInferRequest(
+                "beta_bernoulli",      # model_name
+                "",                   # model_version
+                "test-grpc-raw",       # id
+                Dict{String,InferParameter}(),  # parameters
+                [input_tensor],        # inputs
+                InferRequestedOutputTensor[],  # outputs
+                [raw],                 # raw_input_contents
+            )
+
+            response = KServeV2.KServeV2GRPCServer.handle_model_infer(request)
+            @test response isa ModelInferResponse
+            @test response.id == "test-grpc-raw"
+            @test !isnothing(findfirst(o -> o.name == "posteriors", response.outputs))
+
+            # Raw requests get raw outputs back, one entry per output
+            @test length(response.raw_output_contents) == length(response.outputs)
+            @test all(o -> isnothing(o.contents), response.outputs)
+            fe = findfirst(o -> o.name == "free_energy", response.outputs)
+            if !isnothing(fe)
+                @test length(response.raw_output_contents[fe]) == sizeof(Float64)
+            end
+
+            contents = KServeV2Types.convert_to_kserve_tensor("x", [1.5, -2.0])
+            @test KServeV2Types.convert_to_raw_tensor("FP64", contents) ==
+                  collect(reinterpret(UInt8, htol.([1.5, -2.0])))
+        end
+
         @testset "gRPC Error Handling" begin
             @testset "Non-existent model" begin
                 request = ModelReadyRequest(
@@ -140,6 +184,17 @@ using JSON3
                     request,
                 )
             end
+
+            @testset "Unknown RPC is unimplemented" begin
+                request = HTTP.Request(
+                    "POST",
+                    "/kserve.v2.GRPCInferenceService/ModelStreamInfer",
+                    ["content-type" => "application/grpc"],
+                    UInt8[],
+                )
+                response = KServeV2.KServeV2GRPCServer.handle_grpc_request(request)
+                @test HTTP.header(response, "grpc-status") == "12"
+            end
         end
 
     finally
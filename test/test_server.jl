@@ -2,6 +2,7 @@ using Test
 using RxInferKServe
 using HTTP
 using JSON3
+using CodecZlib
 
 @testset "Server" begin
     # Start server on a random port to avoid conflicts
@@ -100,6 +101,229 @@ using JSON3
             @test !isnothing(posterior_output)
         end
 
+        @testset "Inference Endpoint with binary tensor data" begin
+            y = [1.0, 0.0, 1.0, 1.0, 0.0]
+            raw = collect(reinterpret(UInt8, htol.(y)))
+            header = JSON3.write(
+                Dict(
+                    "id" => "test-binary",
+                    "inputs" => [
+                        Dict(
+                            "name" => "y",
+                            "datatype" => "FP64",
+                            "shape" => [5],
+                            "parameters" => Dict("binary_data_size" => length(raw)),
+                        ),
+                    ],
+                ),
+            )
+
+            response = HTTP.post(
+                "http://localhost:$port/v2/models/beta_bernoulli/infer",
+                [
+                    "Content-Type" => "application/octet-stream",
+                    "Inference-Header-Content-Length" => string(sizeof(header)),
+                ],
+                vcat(Vector{UInt8}(header), raw),
+            )
+
+            @test response.status == 200
+            body = JSON3.read(response.body)
+            @test body["id"] == "test-binary"
+            @test !isnothing(findfirst(o -> o["name"] == "posteriors", body["outputs"]))
+        end
+
+        @testset "Inference Endpoint with binary outputs" begin
+            request_body = Dict(
+                "id" => "test-binary-output",
+                "inputs" => [
+                    Dict(
+                        "name" => "y",
+                        "datatype" => "FP64",
+                        "shape" => [5],
+                        "data" => [1.0, 0.0, 1.0, 1.0, 0.0],
+                    ),
+                ],
+                "parameters" => Dict("binary_data_output" => true),
+            )
+
+            response = HTTP.post(
+                "http://localhost:$port/v2/models/beta_bernoulli/infer",
+                ["Content-Type" => "application/json"],
+                JSON3.write(request_body),
+            )
+
+            @test response.status == 200
+            header_length =
+                parse(Int, HTTP.header(response, "Inference-Header-Content-Length"))
+            body = JSON3.read(response.body[1:header_length])
+            @test body["id"] == "test-binary-output"
+
+            # Posteriors stay JSON; numeric outputs move to the binary section
+            posteriors = findfirst(o -> o["name"] == "posteriors", body["outputs"])
+            @test haskey(body["outputs"][posteriors], "data")
+            offset = header_length
+            for output in body["outputs"]
+                haskey(output, "parameters") || continue
+                nbytes = output["parameters"]["binary_data_size"]
+                @test !haskey(output, "data")
+                @test output["datatype"] == "FP64"
+                values = reinterpret(Float64, response.body[offset+1:offset+nbytes])
+                @test length(values) == prod(output["shape"])
+                offset += nbytes
+            end
+            @test offset == length(response.body)
+        end
+
+        @testset "Inference Endpoint with binary free energy" begin
+            request_body = Dict(
+                "inputs" => [
+                    Dict(
+                        "name" => "y",
+                        "datatype" => "FP64",
+                        "shape" => [5],
+                        "data" => [1.0, 0.0, 1.0, 1.0, 0.0],
+                    ),
+                ],
+                "parameters" => Dict(
+                    "iterations" => 5,
+                    "free_energy" => true,
+                    "binary_data_output" => true,
+                ),
+            )
+
+            response = HTTP.post(
+                "http://localhost:$port/v2/models/beta_bernoulli/infer",
+                ["Content-Type" => "application/json"],
+                JSON3.write(request_body),
+            )
+
+            @test response.status == 200
+            header_length =
+                parse(Int, HTTP.header(response, "Inference-Header-Content-Length"))
+            body = JSON3.read(response.body[1:header_length])
+            fe = findfirst(o -> o["name"] == "free_energy", body["outputs"])
+            @test !isnothing(fe)
+
+            # Free energy is a flat FP64 tensor of its real length
+            offset = header_length
+            for output in body["outputs"]
+                haskey(output, "parameters") || continue
+                nbytes = output["parameters"]["binary_data_size"]
+                if output["name"] == "free_energy"
+                    values = reinterpret(Float64, response.body[offset+1:offset+nbytes])
+                    @test length(values) == only(output["shape"])
+                    @test all(isfinite, values)
+                end
+                offset += nbytes
+            end
+            @test offset == length(response.body)
+        end
+
+        @testset "Inference Endpoint with gzip request body" begin
+            request_body = Dict(
+                "inputs" => [
+                    Dict(
+                        "name" => "y",
+                        "datatype" => "FP64",
+                        "shape" => [5],
+                        "data" => [1.0, 0.0, 1.0, 1.0, 0.0],
+                    ),
+                ],
+                "parameters" => Dict("iterations" => 10),
+            )
+            url = "http://localhost:$port/v2/models/beta_bernoulli/infer"
+
+            response = HTTP.post(
+                url,
+                ["Content-Type" => "application/json", "Content-Encoding" => "gzip"],
+                transcode(GzipCompressor, Vector{UInt8}(JSON3.write(request_body))),
+            )
+            @test response.status == 200
+            @test HTTP.header(response, "Accept-Encoding") == "gzip"
+            body = JSON3.read(response.body)
+            @test !isnothing(findfirst(o -> o["name"] == "posteriors", body["outputs"]))
+
+            # Corrupt and unsupported encodings are rejected up front
+            response = HTTP.post(
+                url,
+                ["Content-Type" => "application/json", "Content-Encoding" => "gzip"],
+                JSON3.write(request_body);
+                status_exception = false,
+            )
+            @test response.status == 400
+
+            response = HTTP.post(
+                url,
+                ["Content-Type" => "application/json", "Content-Encoding" => "br"],
+                JSON3.write(request_body);
+                status_exception = false,
+            )
+            @test response.status == 415
+            @test HTTP.header(response, "Accept-Encoding") == "gzip"
+        end
+
+        @testset "REST output tensors" begin
+            handlers = RxInferKServe.KServeV2.KServeV2HTTPHandlers
+            scalar = handlers.rest_output_tensor("x", 2)
+            @test scalar["datatype"] == "FP64"
+            @test scalar["data"] == [2]
+
+            m = [1.0 2.0; 3.0 4.0]
+            tensor = handlers.rest_output_tensor("m", m)
+            @test tensor["datatype"] == "FP64"
+            @test tensor["shape"] == [2, 2]
+            @test tensor["data"] == [1.0, 2.0, 3.0, 4.0]  # row-major
+
+            a = reshape(collect(1.0:6.0), 1, 2, 3)
+            tensor = handlers.rest_output_tensor("a", a)
+            @test tensor["data"] == vec(permutedims(a, (3, 2, 1)))
+
+            # A 2x3 row-major input decodes to the matrix and encodes back
+            flat = [1.0, 2.0, 3.0, 4.0, 5.0, 6.0]
+            x = handlers.from_row_major(flat, [2, 3])
+            @test x == [1.0 2.0 3.0; 4.0 5.0 6.0]
+            @test handlers.rest_output_tensor("x", x)["data"] == flat
+            @test handlers.rest_output_tensor("x", x)["shape"] == [2, 3]
+
+            # Non-numeric results are kept as JSON-encoded BYTES
+            other = handlers.rest_output_tensor("s", Dict("a" => [1, 2]))
+            @test other["datatype"] == "BYTES"
+            @test JSON3.read(only(other["data"]), Dict{String,Any}) == Dict("a" => [1, 2])
+        end
+
+        @testset "Batched Inference Endpoint" begin
+            y_input = Dict(
+                "name" => "y",
+                "datatype" => "FP64",
+                "shape" => [5],
+                "data" => [1.0, 0.0, 1.0, 1.0, 0.0],
+            )
+            request_body = Dict(
+                "requests" => [
+                    Dict("id" => "batch-1", "inputs" => [y_input]),
+                    Dict("id" => "batch-2", "inputs" => []),  # fails on its own
+                    Dict("id" => "batch-3", "inputs" => [y_input]),
+                ],
+            )
+
+            response = HTTP.post(
+                "http://localhost:$port/v2/models/beta_bernoulli/infer:batch",
+                ["Content-Type" => "application/json"],
+                JSON3.write(request_body),
+            )
+
+            @test response.status == 200
+            body = JSON3.read(response.body)
+            @test length(body["responses"]) == 3
+            @test body["responses"][1]["id"] == "batch-1"
+            @test haskey(body["responses"][2], "error")
+            @test body["responses"][3]["id"] == "batch-3"
+            @test !isnothing(
+                findfirst(o -> o["name"] == "posteriors", body["responses"][3]["outputs"]),
+            )
+        end
+
         @testset "Error Handling" begin
             @testset "Invalid endpoint" begin
                 response =